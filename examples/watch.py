@@ -1,7 +1,11 @@
 """Watch for changes in Photo Library and export the changes to /private/tmp/photokit"""
 
+import collections
+import concurrent.futures
 import datetime
 import os
+import sys
+import threading
 import time
 
 from PyObjCTools import AppHelper
@@ -12,26 +16,89 @@ EXPORT_DIR = "/private/tmp/photokit"
 if not os.path.exists(EXPORT_DIR):
     os.makedirs(EXPORT_DIR)
 
-# maintain dict of processed images to avoid duplicates
-# as sometimes the change observer gets called multiple times
-# for the same image
-_global_processed_images = {}
+# maintain an LRU of recently processed image UUIDs to avoid duplicates
+# as sometimes the change observer gets called multiple times for the
+# same image; bounded so a long-running watcher doesn't grow without limit
+_MAX_PROCESSED_IMAGES = 4096
+_processed_images = collections.OrderedDict()
+
+
+def _already_processed(uuid: str) -> bool:
+    """Return True if uuid was recently processed, otherwise mark it processed"""
+    if uuid in _processed_images:
+        _processed_images.move_to_end(uuid)
+        return True
+    _processed_images[uuid] = None
+    while len(_processed_images) > _MAX_PROCESSED_IMAGES:
+        _processed_images.popitem(last=False)
+    return False
+
+# export in background threads so the change observer callback isn't blocked
+# waiting on disk I/O (or iCloud download) for each asset
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
+def _log_export_done(future: concurrent.futures.Future):
+    """Log results of a background export started by change_observer"""
+    try:
+        print(f"  Exported: {future.result()}")
+    except Exception as e:
+        print(f"  Export failed: {e}")
+
+
+# coalesce rapid-fire change notifications (e.g. during iCloud sync or batch
+# import) by accumulating changes and flushing after a short quiet period so a
+# burst of transactions is processed as a single batch
+_DEBOUNCE_SECONDS = 0.5
+_pending_lock = threading.Lock()
+_pending_changes = {"added": {}, "removed": {}, "updated": {}}
+_flush_timer = None
 
 
 def change_observer(asset: photokit.AssetChanges):
-    """Callback for observing changes to the Photo library"""
-    print(f"change_observer: {datetime.datetime.now()}")
-    for a in asset.added:
-        print(f"added: {a.uuid} {a.original_filename}")
-        if a.screenshot and a.uuid not in _global_processed_images:
+    """Callback for observing changes to the Photo library
+
+    Accumulates changes and (re)schedules a flush so rapid-fire
+    notifications are processed as a single batch.
+    """
+    global _flush_timer
+    with _pending_lock:
+        for a in asset.added:
+            _pending_changes["added"][a.uuid] = a
+        for a in asset.removed:
+            _pending_changes["removed"][a.uuid] = a
+        for a in asset.updated:
+            _pending_changes["updated"][a.uuid] = a
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(_DEBOUNCE_SECONDS, _process_changes)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _process_changes():
+    """Process the accumulated changes from change_observer"""
+    with _pending_lock:
+        added = list(_pending_changes["added"].values())
+        removed = list(_pending_changes["removed"].values())
+        updated = list(_pending_changes["updated"].values())
+        for changes in _pending_changes.values():
+            changes.clear()
+
+    # write the whole batch in one call rather than one print per asset
+    changes = photokit.AssetChanges(added, removed, updated)
+    lines = [f"change_observer: {datetime.datetime.now()}"]
+    lines.extend(
+        f"{category}: {uuid} {filename}"
+        for category, uuid, filename in changes.summary()
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    for a in added:
+        if a.screenshot and not _already_processed(a.uuid):
             print(f"  Exporting new screenshot to {EXPORT_DIR}")
-            results = a.export(EXPORT_DIR)
-            print(f"  Exported: {results}")
-            _global_processed_images[a.uuid] = results
-    for a in asset.removed:
-        print(f"removed: {a.uuid} {a.original_filename}")
-    for a in asset.updated:
-        print(f"updated: {a.uuid} {a.original_filename}")
+            future = _executor.submit(a.export, EXPORT_DIR)
+            future.add_done_callback(_log_export_done)
 
 
 def main():
@@ -1,27 +1,5 @@
 """Python package for accessing the macOS Photos.app library via Apple's native PhotoKit framework."""
 
-import logging
-
-from .album import Album
-from .asset import LivePhotoAsset, PhotoAsset, VideoAsset
-from .exceptions import (
-    PhotoKitAlbumAddAssetError,
-    PhotoKitAlbumCreateError,
-    PhotoKitAlbumDeleteError,
-    PhotoKitAuthError,
-    PhotoKitCreateLibraryError,
-    PhotoKitError,
-    PhotoKitExportError,
-    PhotoKitFetchFailed,
-    PhotoKitImportError,
-    PhotoKitMediaTypeError,
-)
-from .photolibrary import AssetChanges, PhotoLibrary, PhotoLibrarySmartAlbumType
-
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
-
 __version__ = "0.2.1"
 
 __all__ = [
@@ -42,4 +20,50 @@ __all__ = [
     "PhotoLibrary",
     "PhotoLibrarySmartAlbumType",
     "VideoAsset",
+    "export_assets",
 ]
+
+# map of public name to the submodule that provides it; submodules are
+# imported lazily on first attribute access (PEP 562) so that
+# `import photokit` doesn't pay the cost of loading the PyObjC frameworks
+# until a symbol is actually used
+_SUBMODULES = {
+    "Album": "album",
+    "AssetChanges": "photolibrary",
+    "LivePhotoAsset": "asset",
+    "PhotoAsset": "asset",
+    "PhotoKitAlbumAddAssetError": "exceptions",
+    "PhotoKitAlbumCreateError": "exceptions",
+    "PhotoKitAlbumDeleteError": "exceptions",
+    "PhotoKitAuthError": "exceptions",
+    "PhotoKitCreateLibraryError": "exceptions",
+    "PhotoKitError": "exceptions",
+    "PhotoKitExportError": "exceptions",
+    "PhotoKitFetchFailed": "exceptions",
+    "PhotoKitImportError": "exceptions",
+    "PhotoKitMediaTypeError": "exceptions",
+    "PhotoLibrary": "photolibrary",
+    "PhotoLibrarySmartAlbumType": "photolibrary",
+    "VideoAsset": "asset",
+    "export_assets": "asset",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import public names on first access (PEP 562)"""
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    # cache in the module namespace so subsequent accesses skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -3,29 +3,65 @@
 from __future__ import annotations
 
 import datetime
+import sys
 import threading
+import weakref
 from typing import TYPE_CHECKING
 
+import Foundation
 import objc
 import Photos
 
-from .exceptions import PhotoKitAlbumAddAssetError
+from .exceptions import PhotoKitAlbumAddAssetError, PhotoKitError
 from .objc_utils import NSDate_to_datetime
 
 if TYPE_CHECKING:
     from .asset import Asset
     from .photolibrary import PhotoLibrary
 
+# bind the hot PHAssetCollection selectors once at import time; PyObjC
+# otherwise re-resolves the selector on every property access, which
+# dominates when enumerating many albums
+_PHAssetCollection_localIdentifier = Photos.PHAssetCollection.localIdentifier
+_PHAssetCollection_localizedTitle = Photos.PHAssetCollection.localizedTitle
+
 
 class Album:
     """Represents a PHAssetCollection"""
 
+    # use __slots__ to avoid allocating a per-instance __dict__; enumerating
+    # a library can create thousands of short-lived Album wrappers
+    __slots__ = (
+        "_library_ref",
+        "_collection",
+        "_fetch_result_cache",
+        "_local_identifier_cache",
+        "_uuid_cache",
+        "_title_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self, library: PhotoLibrary, collection: Photos.PHAssetCollection
     ) -> None:
         """Initialize Album object with a PHAssetCollection"""
-        self._library = library
+        # hold the library by weak reference to avoid a reference cycle
+        # (PhotoLibrary can transitively reference its Albums); long-running
+        # observers would otherwise depend on the cyclic garbage collector
+        self._library_ref = weakref.ref(library)
         self._collection = collection
+        self._fetch_result_cache = None
+        self._local_identifier_cache = None
+        self._uuid_cache = None
+        self._title_cache = None
+
+    @property
+    def _library(self) -> PhotoLibrary:
+        """Return the PhotoLibrary this Album belongs to"""
+        library = self._library_ref()
+        if library is None:
+            raise PhotoKitError("PhotoLibrary for Album no longer exists")
+        return library
 
     @property
     def collection(self) -> Photos.PHAssetCollection:
@@ -35,17 +71,27 @@ class Album:
     @property
     def local_identifier(self) -> str:
         """Return the local identifier of the underlying PHAssetCollection"""
-        return self._collection.localIdentifier()
+        if self._local_identifier_cache is None:
+            self._local_identifier_cache = _PHAssetCollection_localIdentifier(
+                self._collection
+            )
+        return self._local_identifier_cache
 
     @property
     def uuid(self) -> str:
         """ "Return the UUID of the underlying PHAssetCollection"""
-        return self._collection.localIdentifier().split("/")[0]
+        if self._uuid_cache is None:
+            # intern the UUID; albums and their assets share identifier
+            # prefixes and the same UUID is often fetched repeatedly
+            self._uuid_cache = sys.intern(str(self.local_identifier.split("/")[0]))
+        return self._uuid_cache
 
     @property
     def title(self) -> str:
         """Return the localized title of the underlying PHAssetCollection"""
-        return self._collection.localizedTitle()
+        if self._title_cache is None:
+            self._title_cache = _PHAssetCollection_localizedTitle(self._collection)
+        return self._title_cache
 
     @property
     def estimated_count(self) -> int:
@@ -74,84 +120,187 @@ class Album:
         """Return the location names of the underlying PHAssetCollection"""
         return self._collection.localizedLocationNames()
 
-    def assets(self) -> list[Photos.PHAsset]:
-        """Return a list of PHAssets in the underlying PHAssetCollection"""
-        assets = Photos.PHAsset.fetchAssetsInAssetCollection_options_(
-            self._collection, None
-        )
-        asset_list = []
-        for idx in range(assets.count()):
-            asset_list.append(self._library._asset_factory(assets.objectAtIndex_(idx)))
-        return asset_list
-
-    def add_assets(self, assets: list[Asset]):
-        """Add assets to the underlying album
+    @property
+    def _fetch_result(self) -> Photos.PHFetchResult:
+        """Return the PHFetchResult for assets in the album, fetching it if needed
 
-        Args:
-            assets: list of Asset objects to add to the album
+        The fetch result is cached; the cache is invalidated when assets are
+        added to or removed from the album via add_assets()/remove_assets()
         """
+        if self._fetch_result_cache is None:
+            self._fetch_result_cache = (
+                Photos.PHAsset.fetchAssetsInAssetCollection_options_(
+                    self._collection, None
+                )
+            )
+        return self._fetch_result_cache
 
-        with objc.autorelease_pool():
-            event = threading.Event()
+    def count(self) -> int:
+        """Return the number of assets in the album
 
-            def completion_handler(success, error):
-                if error:
-                    raise PhotoKitAlbumAddAssetError(
-                        f"Error adding asset assets to album {self}: {error}"
-                    )
-                event.set()
+        Unlike len(self.assets()), this does not construct an Asset object
+        per item; unlike estimated_count, it returns the actual count.
+        """
+        return self._fetch_result.count()
+
+    def assets(
+        self,
+        *,
+        media_type: int | None = None,
+        media_subtype: int | None = None,
+        limit: int | None = None,
+        predicate: Foundation.NSPredicate | None = None,
+    ) -> list[Asset]:
+        """Return a list of Assets in the underlying PHAssetCollection
 
-            def album_add_assets_handler(assets):
-                creation_request = Photos.PHAssetCollectionChangeRequest.changeRequestForAssetCollection_(
-                    self.collection
-                )
-                phassets = [a.phasset for a in assets]
-                creation_request.addAssets_(phassets)
+        Args:
+            media_type: optional PHAssetMediaType (e.g. Photos.PHAssetMediaTypeImage) to filter on
+            media_subtype: optional PHAssetMediaSubtype bitmask (e.g. Photos.PHAssetMediaSubtypePhotoScreenshot) to filter on
+            limit: optional maximum number of assets to return
+            predicate: optional NSPredicate for arbitrary filtering
 
-            self._library._phphotolibrary.performChanges_completionHandler_(
-                lambda: album_add_assets_handler(assets), completion_handler
+        Note: Filters are evaluated by PhotoKit against its indexed store so
+        assets that don't match never cross the Python->ObjC bridge.
+        """
+        with objc.autorelease_pool():
+            if (
+                media_type is None
+                and media_subtype is None
+                and limit is None
+                and predicate is None
+            ):
+                assets = self._fetch_result
+            else:
+                options = Photos.PHFetchOptions.alloc().init()
+                predicates = []
+                if media_type is not None:
+                    predicates.append(
+                        Foundation.NSPredicate.predicateWithFormat_(
+                            "mediaType == %d", media_type
+                        )
+                    )
+                if media_subtype is not None:
+                    predicates.append(
+                        Foundation.NSPredicate.predicateWithFormat_(
+                            "(mediaSubtypes & %d) != 0", media_subtype
+                        )
+                    )
+                if predicate is not None:
+                    predicates.append(predicate)
+                if len(predicates) == 1:
+                    options.setPredicate_(predicates[0])
+                elif predicates:
+                    options.setPredicate_(
+                        Foundation.NSCompoundPredicate.andPredicateWithSubpredicates_(
+                            predicates
+                        )
+                    )
+                if limit:
+                    options.setFetchLimit_(limit)
+                assets = Photos.PHAsset.fetchAssetsInAssetCollection_options_(
+                    self._collection, options
+                )
+            # fetch all the PHAssets in a single call rather than one
+            # objectAtIndex_ call per asset; for large albums this avoids
+            # crossing the Python->ObjC bridge once per asset
+            ns_assets = assets.objectsAtIndexes_(
+                Foundation.NSIndexSet.indexSetWithIndexesInRange_((0, assets.count()))
             )
+            return self._library._asset_factory_batch(ns_assets)
 
-            event.wait()
-
-    def remove_assets(self, assets: list[Asset]):
-        """Remove assets from the underlying album
+    def mutate_assets(
+        self,
+        add: list[Asset] | None = None,
+        remove: list[Asset] | None = None,
+        timeout: float | None = 30.0,
+    ):
+        """Add and/or remove assets from the underlying album in a single change transaction
 
         Args:
-            assets: list of Asset objects to remove from the album
+            add: list of Asset objects to add to the album
+            remove: list of Asset objects to remove from the album
+            timeout: seconds to wait for the change to complete before raising
+                PhotoKitAlbumAddAssetError; if None, wait forever
+
+        Raises:
+            PhotoKitAlbumAddAssetError if the change does not complete within timeout
+
+        Note: Callers that need to both add and remove assets should use this
+        method rather than calling add_assets() then remove_assets() as it
+        performs both changes in a single PhotoKit transaction.
         """
 
+        if not add and not remove:
+            return
+
         with objc.autorelease_pool():
             event = threading.Event()
 
+            # resolve the PHAssets before entering the change block; the change
+            # handler runs on PhotoKit's internal queue where Python attribute
+            # access is more expensive and extends the change transaction
+            add_phassets = [a.phasset for a in add] if add else None
+            remove_phassets = [a.phasset for a in remove] if remove else None
+
             def completion_handler(success, error):
                 if error:
                     raise PhotoKitAlbumAddAssetError(
-                        f"Error adding asset assets to album {self}: {error}"
+                        f"Error modifying assets in album {self}: {error}"
                     )
+                # invalidate the cached fetch result as the album contents have changed
+                self._fetch_result_cache = None
                 event.set()
 
-            def album_remove_assets_handler(assets):
-                creation_request = Photos.PHAssetCollectionChangeRequest.changeRequestForAssetCollection_(
+            def album_mutate_assets_handler(add_phassets, remove_phassets):
+                change_request = Photos.PHAssetCollectionChangeRequest.changeRequestForAssetCollection_(
                     self.collection
                 )
-                phassets = [a.phasset for a in assets]
-                creation_request.removeAssets_(phassets)
+                if add_phassets:
+                    change_request.addAssets_(add_phassets)
+                if remove_phassets:
+                    change_request.removeAssets_(remove_phassets)
 
             self._library._phphotolibrary.performChanges_completionHandler_(
-                lambda: album_remove_assets_handler(assets), completion_handler
+                lambda: album_mutate_assets_handler(add_phassets, remove_phassets),
+                completion_handler,
             )
 
-            event.wait()
+            # don't wait forever by default; if PhotoKit never delivers the
+            # completion callback (e.g. permissions revoked mid-transaction)
+            # an untimed wait would deadlock the calling thread
+            if not event.wait(timeout):
+                raise PhotoKitAlbumAddAssetError(
+                    f"Timed out after {timeout} seconds modifying assets in album {self}"
+                )
+
+    def add_assets(self, assets: list[Asset], timeout: float | None = 30.0):
+        """Add assets to the underlying album
+
+        Args:
+            assets: list of Asset objects to add to the album
+            timeout: seconds to wait for the change to complete before raising
+                PhotoKitAlbumAddAssetError; if None, wait forever
+        """
+        self.mutate_assets(add=assets, timeout=timeout)
+
+    def remove_assets(self, assets: list[Asset], timeout: float | None = 30.0):
+        """Remove assets from the underlying album
+
+        Args:
+            assets: list of Asset objects to remove from the album
+            timeout: seconds to wait for the change to complete before raising
+                PhotoKitAlbumAddAssetError; if None, wait forever
+        """
+        self.mutate_assets(remove=assets, timeout=timeout)
 
     def __repr__(self) -> str:
         """Return string representation of Album object"""
-        return f"Album('{self._collection.localizedTitle()}')"
+        return f"Album('{self.title}')"
 
     def __str__(self) -> str:
         """Return string representation of Album object"""
-        return f"Album('{self._collection.localizedTitle()}')"
+        return f"Album('{self.title}')"
 
     def __len__(self) -> int:
         """Return number of assets in the album"""
-        return len(self.assets())
+        return self.count()
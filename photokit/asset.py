@@ -2,26 +2,22 @@
 
 from __future__ import annotations
 
-import copy
+import concurrent.futures
+import contextlib
 import datetime
-import pathlib
+import fcntl
+import os
 import threading
-import time
-from ast import IsNot
-from typing import TYPE_CHECKING, Callable
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Callable, Iterator
 
-import AVFoundation
 import Foundation
 import objc
 import Photos
-import Quartz
-from Foundation import NSURL, NSArray, NSError, NSNotificationCenter, NSObject, NSString
-from PyObjCTools import AppHelper
-from wurlitzer import pipes
+from CoreFoundation import CFRunLoopRunInMode, kCFRunLoopDefaultMode
+from Foundation import NSObject
 
 from .constants import (
-    MIN_SLEEP,
-    PHOTOKIT_NOTIFICATION_FINISHED_REQUEST,
     PHImageRequestOptionsVersionCurrent,
     PHImageRequestOptionsVersionOriginal,
     PHImageRequestOptionsVersionUnadjusted,
@@ -41,7 +37,7 @@ from .objc_utils import (
 )
 from .scriptingbridge import photo_set_description
 from .uti import get_preferred_uti_extension
-from .utils import increment_filename
+from .utils import increment_filename, reserve_unique_path
 
 if TYPE_CHECKING:
     from .photolibrary import PhotoLibrary
@@ -70,6 +66,195 @@ if TYPE_CHECKING:
 # TODO: Add reverseLocationData
 # TODO: Move exporter code to separate class/file?
 
+# AVFoundation, Quartz, and wurlitzer are imported lazily on first use:
+# each PyObjC framework import walks several MB of bridge metadata and
+# registers hundreds of classes, which callers that never export or parse
+# metadata (e.g. reading asset properties only) shouldn't pay for at import
+AVFoundation = None
+Quartz = None
+
+
+def _load_avfoundation():
+    """Import AVFoundation on first use and return the module"""
+    global AVFoundation
+    if AVFoundation is None:
+        import AVFoundation as avfoundation
+
+        AVFoundation = avfoundation
+    return AVFoundation
+
+
+def _load_quartz():
+    """Import Quartz on first use and return the module"""
+    global Quartz
+    if Quartz is None:
+        import Quartz as quartz
+
+        Quartz = quartz
+    return Quartz
+
+
+def _wait_for_completion(event: threading.Event, interval: float = 0.05):
+    """Wait for event signaled by a PhotoKit completion handler
+
+    On the main thread, a bare Event.wait() can stall for multi-second
+    stretches (or deadlock) because PhotoKit may deliver its handler
+    through the main run loop, which never turns while the thread is
+    blocked. Alternate short run-loop pumps with event checks there; on
+    background threads block normally — handlers arrive on PhotoKit's own
+    queue and the run loop isn't involved.
+
+    Each request owns its Event, so completion routing is per-request with
+    no shared registry to synchronize and nothing registered with
+    NSNotificationCenter (observer registration/teardown per request was an
+    earlier design and is deliberately gone).
+    """
+    if threading.current_thread() is threading.main_thread():
+        while not event.is_set():
+            CFRunLoopRunInMode(kCFRunLoopDefaultMode, interval, True)
+    else:
+        event.wait()
+
+
+def _output_capture(suppress: bool):
+    """Return a context manager that captures C-level stdout/stderr if suppress
+
+    wurlitzer's pipes() costs a pipe(2) + dup2(2) + a background reader
+    thread per use and serializes all logging through that thread, so only
+    pay for it when the caller asks; otherwise PhotoKit's logging simply
+    appears on stderr.
+
+    Note: pipes() redirects the process-wide file descriptors, so it is not
+    safe to enable suppression from multiple threads at once (e.g. several
+    concurrent exports); concurrent callers should leave suppress False.
+    """
+    if not suppress:
+        return contextlib.nullcontext((None, None))
+    from wurlitzer import pipes
+
+    return pipes()
+
+
+# pre-bound Photos constants: attribute access on the Photos module goes
+# through PyObjC's lazy-loading proxy, so bind the values used in hot
+# property reads and per-resource loops to plain module globals once
+_MT_IMAGE = Photos.PHAssetMediaTypeImage
+_MT_VIDEO = Photos.PHAssetMediaTypeVideo
+_MT_AUDIO = Photos.PHAssetMediaTypeAudio
+_MST_PANORAMA = Photos.PHAssetMediaSubtypePhotoPanorama
+_MST_HDR = Photos.PHAssetMediaSubtypePhotoHDR
+_MST_SCREENSHOT = Photos.PHAssetMediaSubtypePhotoScreenshot
+_MST_LIVE = Photos.PHAssetMediaSubtypePhotoLive
+_MST_STREAMED = Photos.PHAssetMediaSubtypeVideoStreamed
+_MST_SLOW_MO = Photos.PHAssetMediaSubtypeVideoHighFrameRate
+_MST_TIME_LAPSE = Photos.PHAssetMediaSubtypeVideoTimelapse
+_MST_PORTRAIT = Photos.PHAssetMediaSubtypePhotoDepthEffect
+_RT_PHOTO = Photos.PHAssetResourceTypePhoto
+_RT_VIDEO = Photos.PHAssetResourceTypeVideo
+_RT_ALTERNATE_PHOTO = Photos.PHAssetResourceTypeAlternatePhoto
+_RT_FULL_SIZE_PHOTO = Photos.PHAssetResourceTypeFullSizePhoto
+_RT_ADJUSTMENT_DATA = Photos.PHAssetResourceTypeAdjustmentData
+_RT_PAIRED_VIDEO = Photos.PHAssetResourceTypePairedVideo
+_DELIVERY_HIGH_QUALITY = Photos.PHVideoRequestOptionsDeliveryModeHighQualityFormat
+_MAXIMUM_SIZE = Photos.PHImageManagerMaximumSize
+_CONTENT_MODE_DEFAULT = Photos.PHImageContentModeDefault
+
+# NSPredicates for selecting asset resources by type, built once at import;
+# filteredArrayUsingPredicate_ evaluates the type test in ObjC so resource
+# lookups avoid a Python-level loop with a bridge call per resource
+_PHOTO_RESOURCE_PREDICATE = Foundation.NSPredicate.predicateWithFormat_(
+    "type == %d", _RT_PHOTO
+)
+_VIDEO_RESOURCE_PREDICATE = Foundation.NSPredicate.predicateWithFormat_(
+    "type == %d", _RT_VIDEO
+)
+_ALTERNATE_PHOTO_RESOURCE_PREDICATE = Foundation.NSPredicate.predicateWithFormat_(
+    "type == %d", _RT_ALTERNATE_PHOTO
+)
+_ADJUSTMENT_RESOURCE_PREDICATE = Foundation.NSPredicate.predicateWithFormat_(
+    "type == %d", _RT_ADJUSTMENT_DATA
+)
+
+
+@lru_cache(maxsize=8)
+def _image_request_options(version, synchronous=True):
+    """Return a shared pre-configured PHImageRequestOptions for version
+
+    The options are identical for every request with the same version and
+    PHImageRequestOptions is read-only once handed to the image manager,
+    so one shared instance per configuration saves an alloc/init plus four
+    setter dispatches per request.
+    """
+    options = Photos.PHImageRequestOptions.alloc().init()
+    options.setNetworkAccessAllowed_(True)
+    options.setSynchronous_(synchronous)
+    options.setVersion_(version)
+    options.setDeliveryMode_(
+        Photos.PHImageRequestOptionsDeliveryModeHighQualityFormat
+    )
+    return options
+
+
+@lru_cache(maxsize=1)
+def _resource_request_options():
+    """Return a shared pre-configured PHAssetResourceRequestOptions"""
+    options = Photos.PHAssetResourceRequestOptions.alloc().init()
+    options.setNetworkAccessAllowed_(True)
+    return options
+
+
+@lru_cache(maxsize=8)
+def _video_request_options(version, delivery_mode):
+    """Return a shared pre-configured PHVideoRequestOptions
+
+    Same rationale as _image_request_options: the options are immutable
+    once handed to the image manager, so share one instance per
+    (version, delivery_mode) instead of an alloc/init per request.
+    """
+    options = Photos.PHVideoRequestOptions.alloc().init()
+    options.setNetworkAccessAllowed_(True)
+    options.setVersion_(version)
+    options.setDeliveryMode_(delivery_mode)
+    return options
+
+
+def _write_export_data(data, output_path):
+    """Write exported image/video data to output_path
+
+    Writes through os.write on a raw file descriptor instead of a buffered
+    file object: the data is a single multi-MB bytes-like object so the
+    file object's buffering only adds overhead. On macOS, F_NOCACHE tells
+    the kernel not to cache the written pages — export data is written
+    once and never read back, and caching it would evict more useful pages
+    during a large export.
+
+    Args:
+        data: bytes-like object (bytes or NSData) to write
+        output_path: str, path to write to
+
+    Raises:
+        PhotoKitExportError if an NSData payload fails to write
+    """
+    # if the payload is still an NSData, let it write itself: the buffer
+    # goes straight from the ObjC heap to the kernel without ever being
+    # copied into Python, halving memory bandwidth for large exports
+    if hasattr(data, "writeToFile_atomically_"):
+        with objc.autorelease_pool():
+            if not data.writeToFile_atomically_(output_path, True):
+                raise PhotoKitExportError(f"Error writing data to {output_path}")
+        return
+
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        mv = memoryview(data)
+        while mv:
+            written = os.write(fd, mv)
+            mv = mv[written:]
+    finally:
+        os.close(fd)
+
 
 ### helper classes
 class ImageData:
@@ -77,6 +262,10 @@ class ImageData:
     requestImageDataAndOrientationForAsset_options_resultHandler_
     """
 
+    # __slots__: these holders are created once per request and their
+    # attributes are assigned/read in the hot result handlers
+    __slots__ = ("metadata", "uti", "image_data", "info", "orientation")
+
     def __init__(
         self, metadata=None, uti=None, image_data=None, info=None, orientation=None
     ):
@@ -90,34 +279,29 @@ class ImageData:
 class AVAssetData:
     """Simple class to hold the data passed to the handler for"""
 
-    def __init__(self):
-        self.asset = None
-        self.export_session = None
-        self.info = None
-        self.audiomix = None
+    __slots__ = ("asset", "export_session", "info", "audiomix")
+
+    def __init__(self, asset=None, export_session=None, info=None, audiomix=None):
+        self.asset = asset
+        self.export_session = export_session
+        self.info = info
+        self.audiomix = audiomix
 
 
 class PHAssetResourceData:
     """Simple class to hold data from
     requestDataForAssetResource:options:dataReceivedHandler:completionHandler:
-    """
 
-    def __init__(self):
-        self.data = b""
-
-
-class _PhotoKitNotificationDelegate(NSObject):
-    """Handles notifications from NotificationCenter;
-    used with asynchronous PhotoKit requests to stop event loop when complete
+    data is accumulated in a bytearray, which grows in amortized O(1) per
+    chunk; concatenating bytes per-chunk would be O(N^2) in the total
+    resource size. The bytearray also extends straight from the NSData
+    buffer so each chunk avoids an intermediate Python bytes object.
     """
 
-    def liveNotification_(self, note):
-        if note.name() == PHOTOKIT_NOTIFICATION_FINISHED_REQUEST:
-            AppHelper.stopEventLoop()
+    __slots__ = ("data",)
 
-    def __del__(self):
-        pass
-        # super(NSObject, self).dealloc()
+    def __init__(self):
+        self.data = bytearray()
 
 
 class Asset:
@@ -137,6 +321,64 @@ class PhotoAsset(Asset):
         self._library = library
         self._manager = self._library._phimagemanager
         self._phasset = phasset
+        self._resources_cache = None
+        self._live_photo_resources_cache = {}
+        self._change_batch = None
+        self._tz_cache = None
+        self._snapshot_phasset()
+
+    def _snapshot_phasset(self):
+        """Snapshot immutable scalar properties of the PHAsset
+
+        PHAssets are immutable snapshots so these values cannot change for
+        the lifetime of self._phasset; reading them once here avoids a
+        bridge call on every property access. Called from __init__ and
+        again from _refresh() when self._phasset is replaced.
+        """
+        self._local_identifier = self._phasset.localIdentifier()
+        self._uuid = self._local_identifier.split("/")[0]
+        self._pixel_width = self._phasset.pixelWidth()
+        self._pixel_height = self._phasset.pixelHeight()
+        self._media_type = self._phasset.mediaType()
+        # decode the media subtype bitmask into booleans once; callers such
+        # as export check several of these in sequence and each would
+        # otherwise be a separate mediaSubtypes() message send
+        media_subtypes = self._phasset.mediaSubtypes()
+        self._media_subtypes = media_subtypes
+        self._subtype_flags = {
+            "panorama": bool(media_subtypes & _MST_PANORAMA),
+            "hdr": bool(media_subtypes & _MST_HDR),
+            "screenshot": bool(media_subtypes & _MST_SCREENSHOT),
+            "live": bool(media_subtypes & _MST_LIVE),
+            "streamed": bool(media_subtypes & _MST_STREAMED),
+            "slow_mo": bool(media_subtypes & _MST_SLOW_MO),
+            "time_lapse": bool(media_subtypes & _MST_TIME_LAPSE),
+            "portrait": bool(media_subtypes & _MST_PORTRAIT),
+        }
+
+    @classmethod
+    def from_phassets(cls, library: PhotoLibrary, phassets) -> list[PhotoAsset]:
+        """Construct assets for a collection of PHAssets in a single batch
+
+        Args:
+            library: a PhotoLibrary object
+            phassets: iterable of PHAsset objects (e.g. an NSArray or PHFetchResult)
+
+        Returns:
+            list of cls instances in the same order as phassets
+
+        Note: every PHAsset is wrapped as cls with no per-asset type
+        dispatch, so phassets must be homogeneous — all of the media type
+        cls represents. For a mixed collection use
+        PhotoLibrary._asset_factory_batch, which classifies each asset and
+        builds each homogeneous group through this method.
+
+        The whole batch — including the scalar property snapshot each
+        __init__ takes — runs inside one autorelease pool and one
+        fast-enumeration pass, instead of a pool drain per asset.
+        """
+        with objc.autorelease_pool():
+            return [cls(library, phasset) for phasset in phassets]
 
     @property
     def phasset(self):
@@ -146,121 +388,127 @@ class PhotoAsset(Asset):
     @property
     def uuid(self):
         """Return UUID of PHAsset. This is the same as the local identifier minus the added path component."""
-        return self._phasset.localIdentifier().split("/")[0]
+        return self._uuid
 
     @property
     def local_identifier(self):
         """Return local identifier of PHAsset"""
-        return self._phasset.localIdentifier()
+        return self._local_identifier
 
     @property
     def isphoto(self):
         """Return True if asset is photo (image), otherwise False"""
-        return self.media_type == Photos.PHAssetMediaTypeImage
+        return self.media_type == _MT_IMAGE
 
     @property
     def ismovie(self):
         """Return True if asset is movie (video), otherwise False"""
-        return self.media_type == Photos.PHAssetMediaTypeVideo
+        return self.media_type == _MT_VIDEO
 
     @property
     def isaudio(self):
         """Return True if asset is audio, otherwise False"""
-        return self.media_type == Photos.PHAssetMediaTypeAudio
+        return self.media_type == _MT_AUDIO
 
-    @property
+    @cached_property
     def original_filename(self):
-        """Return original filename asset was imported with"""
-        resources = self._resources()
-        for resource in resources:
-            if (
-                self.isphoto
-                and resource.type() == Photos.PHAssetResourceTypePhoto
-                or not self.isphoto
-                and resource.type() == Photos.PHAssetResourceTypeVideo
-            ):
-                return resource.originalFilename()
+        """Return original filename asset was imported with
+
+        The typed resource is selected ObjC-side via a prebuilt predicate —
+        one bridge call regardless of resource count — and the result is
+        cached for the life of the snapshot.
+        """
+        predicate = (
+            _PHOTO_RESOURCE_PREDICATE if self.isphoto else _VIDEO_RESOURCE_PREDICATE
+        )
+        matches = self._resources().filteredArrayUsingPredicate_(predicate)
+        if matches.count():
+            return matches.firstObject().originalFilename()
         raise PhotoKitFetchFailed("Could not find original filename")
 
-    @property
+    @cached_property
     def raw_filename(self) -> str | None:
         """Return RAW filename for RAW+JPEG photos or None if no RAW asset"""
-        resources = self._resources()
-        for resource in resources:
-            if (
-                self.isphoto
-                and resource.type() == Photos.PHAssetResourceTypeAlternatePhoto
-            ):
-                return resource.originalFilename()
-        return None
+        if not self.isphoto:
+            return None
+        matches = self._resources().filteredArrayUsingPredicate_(
+            _ALTERNATE_PHOTO_RESOURCE_PREDICATE
+        )
+        return matches.firstObject().originalFilename() if matches.count() else None
 
     @property
     def hasadjustments(self) -> bool:
         """Check to see if a PHAsset has adjustment data associated with it
         Returns False if no adjustments, True if any adjustments"""
 
+        # PHAsset responds to hasAdjustments on modern macOS which avoids the
+        # assetResourcesForAsset_ XPC round trip; fall back to scanning the
+        # resources if the selector is unavailable
+        try:
+            return bool(self.phasset.hasAdjustments())
+        except AttributeError:
+            pass
+
         # reference: https://developer.apple.com/documentation/photokit/phassetresource/1623988-assetresourcesforasset?language=objc
 
-        adjustment_resources = Photos.PHAssetResource.assetResourcesForAsset_(
-            self.phasset
-        )
-        return any(
-            (
-                adjustment_resources.objectAtIndex_(idx).type()
-                == Photos.PHAssetResourceTypeAdjustmentData
-            )
-            for idx in range(adjustment_resources.count())
+        # share the cached resource array with the filename/UTI properties
+        # rather than issuing a second assetResourcesForAsset_ round trip;
+        # the predicate filter evaluates the type test in ObjC so there is
+        # one bridge crossing instead of one per resource
+        matches = self._resources().filteredArrayUsingPredicate_(
+            _ADJUSTMENT_RESOURCE_PREDICATE
         )
+        return matches.count() > 0
 
     @property
     def media_type(self) -> str:
         """media type such as image or video"""
-        return self.phasset.mediaType()
+        return self._media_type
 
     @property
     def media_subtypes(self) -> str:
         """media subtype"""
-        return self.phasset.mediaSubtypes()
+        return self._media_subtypes
 
     @property
     def panorama(self) -> bool:
         """return True if asset is panorama, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypePhotoPanorama)
+        return self._subtype_flags["panorama"]
 
     @property
     def hdr(self) -> bool:
         """return True if asset is HDR, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypePhotoHDR)
+        return self._subtype_flags["hdr"]
 
     @property
     def screenshot(self) -> bool:
         """return True if asset is screenshot, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypePhotoScreenshot)
+        return self._subtype_flags["screenshot"]
 
     @property
     def live(self) -> bool:
         """return True if asset is live, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypePhotoLive)
+        return self._subtype_flags["live"]
 
     @property
     def streamed(self) -> bool:
         """return True if asset is streamed video, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypeVideoStreamed)
+        return self._subtype_flags["streamed"]
 
     @property
     def slow_mo(self) -> bool:
         """return True if asset is slow motion (high frame rate) video, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypeVideoHighFrameRate)
+        return self._subtype_flags["slow_mo"]
 
     @property
     def time_lapse(self) -> bool:
         """return True if asset is time lapse video, otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypeVideoTimelapse)
+        return self._subtype_flags["time_lapse"]
 
     @property
     def portrait(self) -> bool:
         """return True if asset is portrait (depth effect), otherwise False"""
-        return bool(self.media_subtypes & Photos.PHAssetMediaSubtypePhotoDepthEffect)
+        return self._subtype_flags["portrait"]
 
     @property
     def burstid(self) -> str | None:
@@ -280,12 +528,12 @@ class PhotoAsset(Asset):
     @property
     def pixel_width(self) -> int:
         """width in pixels"""
-        return self.phasset.pixelWidth()
+        return self._pixel_width
 
     @property
     def pixel_height(self) -> int:
         """height in pixels"""
-        return self.phasset.pixelHeight()
+        return self._pixel_height
 
     @property
     def date(self) -> datetime.datetime:
@@ -334,12 +582,23 @@ class PhotoAsset(Asset):
 
         self._perform_changes(change_request_handler)
 
+    def _get_tz(self):
+        """Return the timezone tuple for the asset from the Photos database
+
+        The query hits SQLite; memoize the full tuple so reading both
+        timezone_offset and timezone costs one query, not two. Invalidated
+        by _refresh() and the timezone setters.
+        """
+        if self._tz_cache is None:
+            self._tz_cache = self._library._photosdb.get_timezone_for_uuid(self.uuid)
+        return self._tz_cache
+
     @property
     def timezone_offset(self) -> int:
         """Timezone offset (seconds from GMT) of the asset"""
         # no property that I can find to retrieve this directly
         # so query the database instead
-        return self._library._photosdb.get_timezone_for_uuid(self.uuid)[0]
+        return self._get_tz()[0]
 
     @timezone_offset.setter
     def timezone_offset(self, tz_offset: int):
@@ -350,12 +609,13 @@ class PhotoAsset(Asset):
             date = change_request.creationDate()
             change_request.setTimeZone_withDate_(timezone, date)
 
+        self._tz_cache = None
         self._perform_changes(change_request_handler)
 
     @property
     def timezone(self) -> str:
         """The named timezone of the asset"""
-        return self._library._photosdb.get_timezone_for_uuid(self.uuid)[2]
+        return self._get_tz()[2]
 
     @timezone.setter
     def timezone(self, tz: str):
@@ -370,6 +630,7 @@ class PhotoAsset(Asset):
                 date = change_request.creationDate()
                 change_request.setTimeZone_withDate_(timezone, date)
 
+            self._tz_cache = None
             self._perform_changes(change_request_handler)
 
     @property
@@ -416,7 +677,8 @@ class PhotoAsset(Asset):
         def change_request_handler(change_request: Photos.PHAssetChangeRequest):
             change_request.setFavorite_(value)
 
-        self._perform_changes(change_request_handler)
+        # no refresh needed: the favorite getter refetches the asset on read
+        self._perform_changes(change_request_handler, refresh=False)
 
     @property
     def hidden(self):
@@ -438,29 +700,34 @@ class PhotoAsset(Asset):
         """Keywords associated with asset"""
         self._refresh()
         keywords = Photos.PHKeyword.fetchKeywordsForAsset_options_(self.phasset, None)
-        return [keywords.objectAtIndex_(idx).title() for idx in range(keywords.count())]
+        return [keyword.title() for keyword in keywords]
 
     @keywords.setter
     def keywords(self, keywords: list[str]):
         """Set keywords associated with asset"""
         with objc.autorelease_pool():
-            # get PHKeyword objects for current keywords
+            # diff by title in pure Python; comparing PHKeyword objects
+            # directly crosses the bridge for every pairwise equality test,
+            # which is O(N*M) message sends for large keyword sets
             current_phkeywords = self._library._keywords_from_title_list(self.keywords)
+            current_by_title = {kw.title(): kw for kw in current_phkeywords}
+            new_titles = set(keywords)
 
             # get PHKeyword objects for new keywords
             try:
                 new_phkeywords = self._library._keywords_from_title_list(keywords)
             except PhotoKitFetchFailed:
                 new_phkeywords = []
-            phkeywords_titles = [kw.title() for kw in new_phkeywords]
+            found_titles = {kw.title() for kw in new_phkeywords}
 
             # are there any new keywords that need to be created?
-            new_keywords = [kw for kw in keywords if kw not in phkeywords_titles]
-            for kw in new_keywords:
+            for kw in new_titles - found_titles:
                 new_phkeywords.append(self._library.create_keyword(kw))
 
             phkeywords_to_remove = [
-                kw for kw in current_phkeywords if kw not in new_phkeywords
+                kw
+                for title, kw in current_by_title.items()
+                if title not in new_titles
             ]
 
             def change_request_handler(change_request: Photos.PHAssetChangeRequest):
@@ -536,8 +803,39 @@ class PhotoAsset(Asset):
         Args:
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
         """
-        imagedata = self._request_image_data(version=version)
-        return imagedata.metadata
+        try:
+            return self._metadata_fast(version=version)
+        except PhotoKitFetchFailed:
+            # file isn't locally available (e.g. iCloud-offloaded);
+            # fall back to requesting the full image data; the transfer
+            # dominates here so there's nothing to gain from feeding
+            # ImageIO an incremental prefix of the already-complete buffer
+            imagedata = self._request_image_data(version=version)
+            return imagedata.metadata
+
+    def _metadata_fast(self, version=PHImageRequestOptionsVersionCurrent):
+        """Return dict of asset metadata read from the file on disk
+
+        ImageIO parses progressively from the file URL, so only the header
+        and metadata chunks are read — typically well under 1 MB even for a
+        50 MB HEIC or RAW — instead of transferring the entire image as
+        NSData the way _request_image_data does.
+
+        Args:
+            version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
+
+        Raises:
+            PhotoKitFetchFailed if the file URL is unavailable or unreadable
+        """
+        url = self._request_content_editing_url(version=version)
+        quartz = _load_quartz()
+        options = {quartz.kCGImageSourceShouldCache: Foundation.kCFBooleanFalse}
+        imgSrc = quartz.CGImageSourceCreateWithURL(url, options)
+        if imgSrc is None:
+            raise PhotoKitFetchFailed(
+                f"Could not read image metadata for asset {self.uuid}"
+            )
+        return quartz.CGImageSourceCopyPropertiesAtIndex(imgSrc, 0, options)
 
     def uti(self, version=PHImageRequestOptionsVersionCurrent):
         """Return UTI of asset
@@ -545,19 +843,26 @@ class PhotoAsset(Asset):
         Args:
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
         """
-        imagedata = self._request_image_data(version=version)
-        return imagedata.uti
+        try:
+            # content editing input carries the UTI without transferring
+            # the image bytes
+            return self._request_content_editing_input(
+                version=version
+            ).uniformTypeIdentifier()
+        except PhotoKitFetchFailed:
+            imagedata = self._request_image_data(version=version)
+            return imagedata.uti
 
     def uti_raw(self):
         """Return UTI of RAW component of RAW+JPEG pair"""
-        resources = self._resources()
-        for resource in resources:
-            if (
-                self.isphoto
-                and resource.type() == Photos.PHAssetResourceTypeAlternatePhoto
-            ):
-                return resource.uniformTypeIdentifier()
-        return None
+        if not self.isphoto:
+            return None
+        matches = self._resources().filteredArrayUsingPredicate_(
+            _ALTERNATE_PHOTO_RESOURCE_PREDICATE
+        )
+        return (
+            matches.firstObject().uniformTypeIdentifier() if matches.count() else None
+        )
 
     def url(self, version=PHImageRequestOptionsVersionCurrent):
         """Return URL of asset
@@ -565,8 +870,7 @@ class PhotoAsset(Asset):
         Args:
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
         """
-        imagedata = self._request_image_data(version=version)
-        return str(imagedata.info["PHImageFileURLKey"])
+        return str(self._request_content_editing_url(version=version))
 
     def path(self, version=PHImageRequestOptionsVersionCurrent):
         """Return path of asset
@@ -574,18 +878,91 @@ class PhotoAsset(Asset):
         Args:
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
         """
-        imagedata = self._request_image_data(version=version)
-        url = imagedata.info["PHImageFileURLKey"]
+        url = self._request_content_editing_url(version=version)
         return url.fileSystemRepresentation().decode("utf-8")
 
+    def _request_content_editing_url(self, version=PHImageRequestOptionsVersionCurrent):
+        """Return NSURL of the asset's image file on disk
+
+        Unlike _request_image_data, this does not transfer the image data
+        itself from photolibraryd (which for a large RAW can be tens of MB
+        just to learn the file path); requestContentEditingInputWithOptions
+        returns the file URL without any data transfer.
+
+        Args:
+            version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
+
+        Returns:
+            NSURL to the asset's full size image file
+
+        Raises:
+            PhotoKitFetchFailed if unable to get the file URL
+        """
+
+        url = self._request_content_editing_input(version=version).fullSizeImageURL()
+        if url is None:
+            raise PhotoKitFetchFailed(f"Could not get file URL for asset {self.uuid}")
+        return url
+
+    def _request_content_editing_input(
+        self, version=PHImageRequestOptionsVersionCurrent
+    ):
+        """Return the PHContentEditingInput for the asset
+
+        The content editing input carries the file URL, UTI, and orientation
+        without transferring the image bytes from photolibraryd, so it is
+        the cheap path for metadata-only queries.
+
+        Args:
+            version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
+
+        Returns:
+            PHContentEditingInput instance
+
+        Raises:
+            PhotoKitFetchFailed if the request returned no input
+        """
+
+        with objc.autorelease_pool():
+            options = Photos.PHContentEditingInputRequestOptions.alloc().init()
+            options.setNetworkAccessAllowed_(True)
+            if version != PHImageRequestOptionsVersionCurrent:
+                # claim we can handle adjustment data so PhotoKit hands back
+                # the original file instead of rendering the edited version
+                options.setCanHandleAdjustmentData_(lambda adjustment_data: True)
+
+            event = threading.Event()
+            results = {}
+
+            def completion_handler(content_editing_input, info):
+                results["input"] = content_editing_input
+                event.set()
+
+            self.phasset.requestContentEditingInputWithOptions_completionHandler_(
+                options, completion_handler
+            )
+            _wait_for_completion(event)
+
+            content_editing_input = results.get("input")
+            if content_editing_input is None:
+                raise PhotoKitFetchFailed(
+                    f"Could not get content editing input for asset {self.uuid}"
+                )
+            return content_editing_input
+
     def orientation(self, version=PHImageRequestOptionsVersionCurrent):
         """Return orientation of asset
 
         Args:
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
         """
-        imagedata = self._request_image_data(version=version)
-        return imagedata.orientation
+        try:
+            return self._request_content_editing_input(
+                version=version
+            ).fullSizeImageOrientation()
+        except PhotoKitFetchFailed:
+            imagedata = self._request_image_data(version=version)
+            return imagedata.orientation
 
     def degraded(self, version=PHImageRequestOptionsVersionCurrent):
         """Return True if asset is degraded version
@@ -616,6 +993,50 @@ class PhotoAsset(Asset):
         # this shouldn't be necessary but sometimes after creating a change (for example, toggling favorite)
         # the properties do not refresh
         self._phasset = self._library.asset(self.uuid)._phasset
+        # drop cached values derived from the old PHAsset
+        self._snapshot_phasset()
+        self._resources_cache = None
+        self._live_photo_resources_cache = {}
+        self._tz_cache = None
+        for cached in ("original_filename", "raw_filename"):
+            self.__dict__.pop(cached, None)
+
+    @contextlib.contextmanager
+    def batch_changes(self):
+        """Coalesce multiple property changes into a single change transaction
+
+        Each property setter normally runs its own performChanges transaction,
+        an XPC round trip to photolibraryd per property. Inside this context
+        the setters queue their changes instead and one transaction applies
+        them all on exit (followed by a single refresh), e.g.:
+
+            with asset.batch_changes():
+                asset.favorite = True
+                asset.date = date
+                asset.title = "title"
+
+        Raises:
+            PhotoKitChangeError if batches are nested or the transaction fails
+        """
+        if self._change_batch is not None:
+            raise PhotoKitChangeError("batch_changes contexts cannot be nested")
+        self._change_batch = []
+        try:
+            yield self
+        except BaseException:
+            # discard queued changes if the body failed
+            self._change_batch = None
+            raise
+        batch = self._change_batch
+        self._change_batch = None
+        if not batch:
+            return
+
+        def batched_handler(change_request: Photos.PHAssetChangeRequest):
+            for handler, _ in batch:
+                handler(change_request)
+
+        self._apply_changes(batched_handler, any(refresh for _, refresh in batch))
 
     def _perform_changes(
         self,
@@ -624,10 +1045,25 @@ class PhotoAsset(Asset):
     ):
         """Perform changes on a PHAsset
 
+        If a batch_changes() context is open, the change is queued and applied
+        with the rest of the batch when the context exits; otherwise it runs
+        in its own transaction immediately.
+
         Args:
             change_request_handler: a callable that will be passed the PHAssetChangeRequest to perform changes
             refresh: if True, refresh the asset from the library after performing changes (default is True)
         """
+        if self._change_batch is not None:
+            self._change_batch.append((change_request_handler, refresh))
+            return
+        self._apply_changes(change_request_handler, refresh)
+
+    def _apply_changes(
+        self,
+        change_request_handler: Callable[[Photos.PHAssetChangeRequest], None],
+        refresh: bool = True,
+    ):
+        """Run one performChanges transaction for change_request_handler"""
 
         with objc.autorelease_pool():
 
@@ -682,6 +1118,32 @@ class PhotoAsset(Asset):
     #         if refresh:
     #             self._refresh()
 
+    def _resolve_export_dest(self, dest, filename=None):
+        """Resolve export destination directory and filename stem
+
+        Shared by the export methods so the path handling (and its
+        validation) lives in one place; plain string/os.path manipulation
+        here as constructing pathlib.Path objects several times per call
+        is measurable overhead when exporting thousands of assets.
+
+        Args:
+            dest: str or path-like, destination directory
+            filename: optional filename; defaults to the asset's original filename
+
+        Returns:
+            tuple of (stem, dest) as str
+
+        Raises:
+            ValueError if dest is not a valid directory
+        """
+        stem = os.path.splitext(
+            os.path.basename(str(filename or self.original_filename))
+        )[0]
+        dest = str(dest)
+        if not os.path.isdir(dest):
+            raise ValueError(f"dest must be a valid directory: {dest}")
+        return stem, dest
+
     def export(
         self,
         dest,
@@ -689,6 +1151,7 @@ class PhotoAsset(Asset):
         version=PHImageRequestOptionsVersionCurrent,
         overwrite=False,
         raw=False,
+        suppress_output=False,
         **kwargs,
     ):
         """Export image to path
@@ -699,6 +1162,7 @@ class PhotoAsset(Asset):
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
             overwrite: bool, if True, overwrites destination file if it already exists; default is False
             raw: bool, if True, export RAW component of RAW+JPEG pair, default is False
+            suppress_output: bool, if True, capture C-level stdout/stderr during export; default is False (PhotoKit logging appears on stderr)
             **kwargs: used only to avoid issues with each asset type having slightly different export arguments
 
         Returns:
@@ -709,76 +1173,93 @@ class PhotoAsset(Asset):
         """
 
         with objc.autorelease_pool():
-            with pipes() as (out, err):
-                filename = (
-                    pathlib.Path(filename)
-                    if filename
-                    else pathlib.Path(self.original_filename)
-                )
-
-                dest = pathlib.Path(dest)
-                if not dest.is_dir():
-                    raise ValueError("dest must be a valid directory: {dest}")
+            with _output_capture(suppress_output) as (out, err):
+                stem, dest = self._resolve_export_dest(dest, filename)
 
                 output_file = None
                 if self.isphoto:
-                    # will hold exported image data and needs to be cleaned up at end
-                    imagedata = None
                     if raw:
                         # export the raw component
                         resources = self._resources()
                         for resource in resources:
-                            if (
-                                resource.type()
-                                == Photos.PHAssetResourceTypeAlternatePhoto
-                            ):
-                                data = self._request_resource_data(resource)
-                                suffix = pathlib.Path(self.raw_filename).suffix
+                            if resource.type() == _RT_ALTERNATE_PHOTO:
+                                raw_resource = resource
+                                # use the resource already in hand rather than
+                                # re-scanning resources via self.raw_filename
+                                suffix = os.path.splitext(resource.originalFilename())[1]
                                 ext = suffix[1:] if suffix else ""
                                 break
                         else:
                             raise PhotoKitExportError(
                                 "Could not get image data for RAW photo"
                             )
+
+                        output_file = os.path.join(dest, f"{stem}.{ext}")
+                        if not overwrite:
+                            output_file = increment_filename(output_file)
+
+                        # stream the resource straight to disk rather than
+                        # buffering the full RAW file in memory with
+                        # _request_resource_data then writing it back out
+                        self._write_resource_to_file(raw_resource, output_file)
+                        return [output_file]
                     else:
-                        # TODO: if user has selected use RAW as original, this returns the RAW
-                        # can get the jpeg with resource.type() == Photos.PHAssetResourceTypePhoto
-                        imagedata = self._request_image_data(version=version)
+                        # prefer streaming the photo resource straight to
+                        # disk: no Python-side copy of the image bytes and,
+                        # unlike requestImageDataAndOrientation..., explicit
+                        # control over which variant is fetched (the image
+                        # data request honors the "use RAW as original"
+                        # preference and can surprise-return DNG bytes)
+                        resource = self._photo_resource_for_version(version)
+                        if resource is not None:
+                            ext = get_preferred_uti_extension(
+                                resource.uniformTypeIdentifier()
+                            )
+                            output_file = os.path.join(dest, f"{stem}.{ext}")
+                            if not overwrite:
+                                output_file = increment_filename(output_file)
+                            self._write_resource_to_file(resource, output_file)
+                            return [output_file]
+
+                        # export only needs the bytes and UTI; skip the
+                        # CGImageSource metadata parse
+                        imagedata = self._request_image_data(
+                            version=version, want_metadata=False
+                        )
                         if not imagedata.image_data:
                             raise PhotoKitExportError("Could not get image data")
                         ext = get_preferred_uti_extension(imagedata.uti)
                         data = imagedata.image_data
 
-                    output_file = dest / f"{filename.stem}.{ext}"
+                    output_file = os.path.join(dest, f"{stem}.{ext}")
 
                     if not overwrite:
-                        output_file = pathlib.Path(increment_filename(output_file))
-
-                    with open(output_file, "wb") as fd:
-                        fd.write(data)
+                        output_file = increment_filename(output_file)
 
-                    if imagedata:
-                        del imagedata
+                    _write_export_data(data, output_file)
                 elif self.ismovie:
                     videodata = self._request_video_data(version=version)
                     if videodata.asset is None:
                         raise PhotoKitExportError("Could not get video for asset")
 
                     url = videodata.asset.URL()
-                    path = pathlib.Path(NSURL_to_path(url))
-                    if not path.is_file():
+                    path = NSURL_to_path(url)
+                    if not os.path.isfile(path):
                         raise FileNotFoundError("Could not get path to video file")
-                    ext = path.suffix
-                    output_file = dest / f"{filename.stem}{ext}"
+                    ext = os.path.splitext(path)[1]
+                    output_file = os.path.join(dest, f"{stem}{ext}")
 
                     if not overwrite:
-                        output_file = pathlib.Path(increment_filename(output_file))
+                        output_file = increment_filename(output_file)
 
-                    FileUtil.copy(path, output_file)
+                    # clone on APFS when possible; O(1) vs a full byte copy
+                    FileUtil.clone_or_copy(path, output_file)
 
-                return [str(output_file)]
+                return [output_file]
 
-    def _request_image_data(self, version=PHImageRequestOptionsVersionOriginal):
+    def _request_image_data(
+        self, version=PHImageRequestOptionsVersionOriginal, want_metadata: bool = True
+    ):
         """Request image data and metadata for self._phasset
 
         Args:
@@ -786,64 +1267,85 @@ class PhotoAsset(Asset):
                      PHImageRequestOptionsVersionOriginal (default), request original highest fidelity version
                      PHImageRequestOptionsVersionCurrent, request current version with all edits
                      PHImageRequestOptionsVersionUnadjusted, request highest quality unadjusted version
+            want_metadata: if True (default), parse the image with CGImageSource
+                     and set ImageData.metadata; callers that only need the raw
+                     bytes (e.g. export) should pass False to skip the parse
 
         Returns:
-            ImageData instance
+            ImageData instance; metadata is None if want_metadata is False
 
         Raises:
             ValueError if passed invalid value for version
         """
 
-        # reference: https://developer.apple.com/documentation/photokit/phimagemanager/3237282-requestimagedataandorientationfo?language=objc
-
         with objc.autorelease_pool():
-            if version not in [
-                PHImageRequestOptionsVersionCurrent,
-                PHImageRequestOptionsVersionOriginal,
-                PHImageRequestOptionsVersionUnadjusted,
-            ]:
-                raise ValueError("Invalid value for version")
-
-            options_request = Photos.PHImageRequestOptions.alloc().init()
-            options_request.setNetworkAccessAllowed_(True)
-            options_request.setSynchronous_(True)
-            options_request.setVersion_(version)
-            options_request.setDeliveryMode_(
-                Photos.PHImageRequestOptionsDeliveryModeHighQualityFormat
+            future = self._request_image_data_async(
+                version=version, want_metadata=want_metadata
             )
-            requestdata = ImageData()
             event = threading.Event()
+            future.add_done_callback(lambda _future: event.set())
+            _wait_for_completion(event)
+            return future.result()
 
-            def handler(imageData, dataUTI, orientation, info):
-                """result handler for requestImageDataAndOrientationForAsset_options_resultHandler_
-                all returned by the request is set as properties of nonlocal data (Fetchdata object)
-                """
+    def _request_image_data_async(
+        self, version=PHImageRequestOptionsVersionOriginal, want_metadata: bool = True
+    ) -> concurrent.futures.Future:
+        """Request image data for self._phasset without blocking
 
-                nonlocal requestdata
+        The request is dispatched asynchronously (setSynchronous_(False)) so
+        a caller can have many requests in flight and collect the results as
+        futures resolve, rather than tying up one thread per request the way
+        the synchronous mode does.
 
-                options = {Quartz.kCGImageSourceShouldCache: Foundation.kCFBooleanFalse}
-                imgSrc = Quartz.CGImageSourceCreateWithData(imageData, options)
-                requestdata.metadata = Quartz.CGImageSourceCopyPropertiesAtIndex(
-                    imgSrc, 0, options
-                )
+        Args:
+            version: which version to request (see _request_image_data)
+            want_metadata: if True (default), parse the image with CGImageSource
+
+        Returns:
+            concurrent.futures.Future resolving to an ImageData instance
+
+        Raises:
+            ValueError if passed invalid value for version
+        """
+
+        # reference: https://developer.apple.com/documentation/photokit/phimagemanager/3237282-requestimagedataandorientationfo?language=objc
+
+        if version not in [
+            PHImageRequestOptionsVersionCurrent,
+            PHImageRequestOptionsVersionOriginal,
+            PHImageRequestOptionsVersionUnadjusted,
+        ]:
+            raise ValueError("Invalid value for version")
+
+        if want_metadata:
+            _load_quartz()
+        options_request = _image_request_options(version, synchronous=False)
+        future = concurrent.futures.Future()
+
+        def handler(imageData, dataUTI, orientation, info):
+            """result handler for requestImageDataAndOrientationForAsset_options_resultHandler_"""
+            try:
+                requestdata = ImageData()
+                if want_metadata:
+                    options = {
+                        Quartz.kCGImageSourceShouldCache: Foundation.kCFBooleanFalse
+                    }
+                    imgSrc = Quartz.CGImageSourceCreateWithData(imageData, options)
+                    requestdata.metadata = Quartz.CGImageSourceCopyPropertiesAtIndex(
+                        imgSrc, 0, options
+                    )
                 requestdata.uti = dataUTI
                 requestdata.orientation = orientation
                 requestdata.info = info
                 requestdata.image_data = imageData
+                future.set_result(requestdata)
+            except Exception as e:
+                future.set_exception(e)
 
-                event.set()
-
-            self._manager.requestImageDataAndOrientationForAsset_options_resultHandler_(
-                self.phasset, options_request, handler
-            )
-            event.wait()
-            # options_request.dealloc()
-
-            # not sure why this is needed -- some weird ref count thing maybe
-            # if I don't do this, memory leaks
-            data = copy.copy(requestdata)
-            del requestdata
-            return data
+        self._manager.requestImageDataAndOrientationForAsset_options_resultHandler_(
+            self.phasset, options_request, handler
+        )
+        return future
 
     def _request_resource_data(self, resource):
         """Request asset resource data (either photo or video component)
@@ -851,25 +1353,32 @@ class PhotoAsset(Asset):
         Args:
             resource: PHAssetResource to request
 
+        Returns:
+            the resource data as a bytearray; ownership of the buffer is
+            transferred to the caller so no full-size copy is made
+
         Raises:
         """
 
         with objc.autorelease_pool():
             resource_manager = Photos.PHAssetResourceManager.defaultManager()
-            options = Photos.PHAssetResourceRequestOptions.alloc().init()
-            options.setNetworkAccessAllowed_(True)
+            options = _resource_request_options()
 
             requestdata = PHAssetResourceData()
             event = threading.Event()
 
             def handler(data):
-                """result handler for requestImageDataAndOrientationForAsset_options_resultHandler_
-                all returned by the request is set as properties of nonlocal data (Fetchdata object)
+                """dataReceivedHandler for
+                requestDataForAssetResource_options_dataReceivedHandler_completionHandler_;
+                appends each chunk to the nonlocal requestdata
                 """
 
                 nonlocal requestdata
 
-                requestdata.data += data
+                # NSData.bytes() exposes the chunk via the buffer protocol
+                # so extend copies it into the bytearray without first
+                # materializing a separate Python bytes object
+                requestdata.data.extend(data.bytes())
 
             def completion_handler(error):
                 if error:
@@ -882,14 +1391,138 @@ class PhotoAsset(Asset):
                 resource, options, handler, completion_handler
             )
 
-            event.wait()
+            _wait_for_completion(event)
 
-            # not sure why this is needed -- some weird ref count thing maybe
-            # if I don't do this, memory leaks
-            data = copy.copy(requestdata.data)
-            del requestdata
+            # hand the accumulated buffer to the caller rather than paying
+            # a final full-size copy into bytes; for a multi-GB resource
+            # that copy briefly doubles peak memory
+            data = requestdata.data
+            requestdata.data = bytearray()
             return data
 
+    def _stream_resource_to_file(self, resource, output_path, fd=None):
+        """Stream a PHAssetResource to a file chunk by chunk
+
+        Unlike _request_resource_data, the resource is never materialized
+        in memory: each NSData chunk delivered by the dataReceivedHandler
+        is written straight to disk, bounding peak memory at one chunk
+        (~256 KB) rather than the full file, so multi-GB slow-mo/ProRes
+        clips export without memory thrash.
+
+        Args:
+            resource: PHAssetResource to stream
+            output_path: str, path to write the resource to
+            fd: optional open file descriptor for output_path (e.g. from
+                reserve_unique_path()); if provided it is used for the writes
+                and closed on return
+
+        Raises:
+            PhotoKitExportError if error during streaming
+        """
+
+        resource_manager = Photos.PHAssetResourceManager.defaultManager()
+        options = _resource_request_options()
+
+        event = threading.Event()
+        errors = []
+
+        if fd is None:
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        if hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+
+        def handler(data):
+            """dataReceivedHandler; writes each chunk as it arrives"""
+            # pool per chunk so each NSData drops as soon as it's written
+            with objc.autorelease_pool():
+                # NSData.bytes() exposes the ObjC-owned buffer via the
+                # buffer protocol so each chunk is written straight from
+                # that buffer instead of being copied into Python bytes
+                view = memoryview(data.bytes())
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+
+        def completion_handler(error):
+            if error:
+                errors.append(error)
+            event.set()
+
+        try:
+            resource_manager.requestDataForAssetResource_options_dataReceivedHandler_completionHandler_(
+                resource, options, handler, completion_handler
+            )
+            _wait_for_completion(event)
+        finally:
+            os.close(fd)
+
+        if errors:
+            raise PhotoKitExportError(
+                f"Error streaming resource to {output_path}: {errors[0]}"
+            )
+
+    def _photo_resource_for_version(self, version):
+        """Return the PHAssetResource to export for version, or None
+
+        For the current version of an edited photo this is the full size
+        render (PHAssetResourceTypeFullSizePhoto); for the original or an
+        unedited photo it is the original photo resource
+        (PHAssetResourceTypePhoto). Returns None when the right variant
+        cannot be determined from the resources alone (e.g. the unadjusted
+        version) and the caller should fall back to _request_image_data.
+
+        Args:
+            version: one of PHImageRequestOptionsVersionCurrent/Original/Unadjusted
+        """
+        if version == PHImageRequestOptionsVersionUnadjusted:
+            return None
+        resources = self._resources()
+        if version == PHImageRequestOptionsVersionCurrent and self.hasadjustments:
+            for resource in resources:
+                if resource.type() == _RT_FULL_SIZE_PHOTO:
+                    return resource
+            return None
+        for resource in resources:
+            if resource.type() == _RT_PHOTO:
+                return resource
+        return None
+
+    def _write_resource_to_file(self, resource, output_path):
+        """Write a PHAssetResource directly to a file
+
+        Args:
+            resource: PHAssetResource to write
+            output_path: str or pathlib.Path, path to write the resource to
+
+        Raises:
+            PhotoKitExportError if error during write
+
+        Note: PhotoKit streams the resource to disk so, unlike
+        _request_resource_data, the full resource is never held in memory.
+        """
+
+        with objc.autorelease_pool():
+            resource_manager = Photos.PHAssetResourceManager.defaultManager()
+            options = _resource_request_options()
+
+            event = threading.Event()
+            errors = []
+
+            def completion_handler(error):
+                if error:
+                    errors.append(error)
+                event.set()
+
+            resource_manager.writeDataForAssetResource_toFile_options_completionHandler_(
+                resource, path_to_NSURL(str(output_path)), options, completion_handler
+            )
+
+            _wait_for_completion(event)
+            if errors:
+                raise PhotoKitExportError(
+                    f"Error writing resource to {output_path}: {errors[0]}"
+                )
+
     def _make_result_handle_(self, data):
         """Make handler function and threading event to use with
         requestImageDataAndOrientationForAsset_options_resultHandler_
@@ -898,6 +1531,7 @@ class PhotoAsset(Asset):
         Following call to requestImageDataAndOrientationForAsset_options_resultHandler_,
         data will hold data from the fetch"""
 
+        _load_quartz()
         event = threading.Event()
 
         def handler(imageData, dataUTI, orientation, info):
@@ -922,9 +1556,20 @@ class PhotoAsset(Asset):
         return handler, event
 
     def _resources(self):
-        """Return list of PHAssetResource for object"""
-        resources = Photos.PHAssetResource.assetResourcesForAsset_(self.phasset)
-        return [resources.objectAtIndex_(idx) for idx in range(resources.count())]
+        """Return NSArray of PHAssetResource for object
+
+        The resources are cached on first access; properties such as
+        original_filename, raw_filename, and uti_raw are often read
+        back-to-back (e.g. during export) and shouldn't each re-fetch
+        the resources from PhotoKit. Kept as an NSArray so callers can
+        use filteredArrayUsingPredicate_; iterating it from Python still
+        uses fast enumeration.
+        """
+        if self._resources_cache is None:
+            self._resources_cache = Photos.PHAssetResource.assetResourcesForAsset_(
+                self.phasset
+            )
+        return self._resources_cache
 
 
 class _SlowMoVideoExporter(NSObject):
@@ -940,16 +1585,33 @@ class _SlowMoVideoExporter(NSObject):
             return None
         self.avasset = avasset
         self.url = path_to_NSURL(path)
-        self.nc = NSNotificationCenter.defaultCenter()
+        self.session = None
         return self
 
+    def progress(self):
+        """Return export progress as a float in 0.0-1.0, or 0.0 if no export is running
+
+        Reads the live value from the session on demand; AVAssetExportSession's
+        progress property is not key-value observable so callers that want
+        updates sample this from another thread at whatever rate suits them.
+        """
+        return float(self.session.progress()) if self.session is not None else 0.0
+
     def exportSlowMoVideo(self):
         """export slow-mo video with AVAssetExportSession
 
+        Blocks until the export finishes but polls on a short interval so
+        the export can be cancelled with a KeyboardInterrupt; progress()
+        can be read from another thread while the export runs.
+
         Returns:
             path to exported file
+
+        Raises:
+            PhotoKitExportError if export fails or is cancelled
         """
 
+        _load_avfoundation()
         with objc.autorelease_pool():
             exporter = (
                 AVFoundation.AVAssetExportSession.alloc().initWithAsset_presetName_(
@@ -959,29 +1621,34 @@ class _SlowMoVideoExporter(NSObject):
             exporter.setOutputURL_(self.url)
             exporter.setOutputFileType_(AVFoundation.AVFileTypeQuickTimeMovie)
             exporter.setShouldOptimizeForNetworkUse_(True)
+            self.session = exporter
 
-            self.done = False
+            done_event = threading.Event()
 
             def handler():
                 """result handler for exportAsynchronouslyWithCompletionHandler"""
-                self.done = True
+                done_event.set()
 
             exporter.exportAsynchronouslyWithCompletionHandler_(handler)
-            # wait for export to complete
-            # would be more elegant to use a dispatch queue, notification, or thread event to wait
-            # but I can't figure out how to make that work and this does work
-            while True:
-                status = exporter.status()
-                if status == AVFoundation.AVAssetExportSessionStatusCompleted:
-                    break
-                elif status not in (
-                    AVFoundation.AVAssetExportSessionStatusWaiting,
-                    AVFoundation.AVAssetExportSessionStatusExporting,
-                ):
-                    raise PhotoKitExportError(
-                        f"Error encountered during exportAsynchronouslyWithCompletionHandler: status = {status}"
-                    )
-                time.sleep(MIN_SLEEP)
+            try:
+                # completion is pushed by the handler — these are event waits,
+                # not status polls; the export wakes us the moment it ends.
+                # Wait in short slices rather than one indefinite block only
+                # so Ctrl-C is serviced between waits and can cancel the
+                # export instead of leaving the session running past the
+                # process
+                while not done_event.wait(0.1):
+                    pass
+            except KeyboardInterrupt:
+                exporter.cancelExport()
+                self.session = None
+                raise
+            status = exporter.status()
+            self.session = None
+            if status != AVFoundation.AVAssetExportSessionStatusCompleted:
+                raise PhotoKitExportError(
+                    f"Error encountered during exportAsynchronouslyWithCompletionHandler: status = {status}"
+                )
 
             exported_path = NSURL_to_path(exporter.outputURL())
             # exporter.dealloc()
@@ -991,8 +1658,6 @@ class _SlowMoVideoExporter(NSObject):
         self.avasset = None
         self.url.dealloc()
         self.url = None
-        self.done = None
-        self.nc = None
 
 
 class VideoAsset(PhotoAsset):
@@ -1009,6 +1674,7 @@ class VideoAsset(PhotoAsset):
         filename=None,
         version=PHImageRequestOptionsVersionCurrent,
         overwrite=False,
+        suppress_output=False,
         **kwargs,
     ):
         """Export video to path
@@ -1018,6 +1684,7 @@ class VideoAsset(PhotoAsset):
             filename: str, optional name of exported file; if not provided, defaults to asset's original filename
             version: which version of image (PHImageRequestOptionsVersionOriginal or PHImageRequestOptionsVersionCurrent)
             overwrite: bool, if True, overwrites destination file if it already exists; default is False
+            suppress_output: bool, if True, capture C-level stdout/stderr during export; default is False (PhotoKit logging appears on stderr)
             **kwargs: used only to avoid issues with each asset type having slightly different export arguments
 
         Returns:
@@ -1028,7 +1695,7 @@ class VideoAsset(PhotoAsset):
         """
 
         with objc.autorelease_pool():
-            with pipes() as (out, err):
+            with _output_capture(suppress_output) as (out, err):
                 if self.slow_mo and version == PHImageRequestOptionsVersionCurrent:
                     return [
                         self._export_slow_mo(
@@ -1039,15 +1706,7 @@ class VideoAsset(PhotoAsset):
                         )
                     ]
 
-                filename = (
-                    pathlib.Path(filename)
-                    if filename
-                    else pathlib.Path(self.original_filename)
-                )
-
-                dest = pathlib.Path(dest)
-                if not dest.is_dir():
-                    raise ValueError("dest must be a valid directory: {dest}")
+                stem, dest = self._resolve_export_dest(dest, filename)
 
                 output_file = None
                 videodata = self._request_video_data(version=version)
@@ -1055,19 +1714,20 @@ class VideoAsset(PhotoAsset):
                     raise PhotoKitExportError("Could not get video for asset")
 
                 url = videodata.asset.URL()
-                path = pathlib.Path(NSURL_to_path(url))
+                path = NSURL_to_path(url)
                 del videodata
-                if not path.is_file():
+                if not os.path.isfile(path):
                     raise FileNotFoundError("Could not get path to video file")
-                ext = path.suffix
-                output_file = dest / f"{filename.stem}{ext}"
+                ext = os.path.splitext(path)[1]
+                output_file = os.path.join(dest, f"{stem}{ext}")
 
                 if not overwrite:
-                    output_file = pathlib.Path(increment_filename(output_file))
+                    output_file = increment_filename(output_file)
 
-                FileUtil.copy(path, output_file)
+                # clone on APFS when possible; O(1) vs a full byte copy
+                FileUtil.clone_or_copy(path, output_file)
 
-                return [str(output_file)]
+                return [output_file]
 
     def _export_slow_mo(
         self,
@@ -1094,27 +1754,23 @@ class VideoAsset(PhotoAsset):
             if not self.slow_mo:
                 raise PhotoKitMediaTypeError("Not a slow-mo video")
 
+            _load_avfoundation()
             videodata = self._request_video_data(version=version)
-            if (
-                not isinstance(videodata.asset, AVFoundation.AVComposition)
-                or len(videodata.asset.tracks()) != 2
-            ):
+            if videodata.asset is None:
+                raise PhotoKitExportError("Could not get video for asset")
+            # slow-mo subtype was already verified above; checking the class
+            # is enough and avoids materializing the composition's track
+            # list; isKindOfClass_ is a single ObjC message where isinstance
+            # goes through the bridge's metatype machinery
+            if not videodata.asset.isKindOfClass_(AVFoundation.AVComposition):
                 raise PhotoKitMediaTypeError("Does not appear to be slow-mo video")
 
-            filename = (
-                pathlib.Path(filename)
-                if filename
-                else pathlib.Path(self.original_filename)
-            )
+            stem, dest = self._resolve_export_dest(dest, filename)
 
-            dest = pathlib.Path(dest)
-            if not dest.is_dir():
-                raise ValueError("dest must be a valid directory: {dest}")
-
-            output_file = dest / f"{filename.stem}.mov"
+            output_file = os.path.join(dest, f"{stem}.mov")
 
             if not overwrite:
-                output_file = pathlib.Path(increment_filename(output_file))
+                output_file = increment_filename(output_file)
 
             exporter = _SlowMoVideoExporter.alloc().initWithAVAsset_path_(
                 videodata.asset, output_file
@@ -1124,7 +1780,11 @@ class VideoAsset(PhotoAsset):
             return video
 
     # todo: rewrite this with NotificationCenter and App event loop?
-    def _request_video_data(self, version=PHImageRequestOptionsVersionOriginal):
+    def _request_video_data(
+        self,
+        version=PHImageRequestOptionsVersionOriginal,
+        delivery_mode=None,
+    ):
         """Request video data for self._phasset
 
         Args:
@@ -1132,6 +1792,10 @@ class VideoAsset(PhotoAsset):
                      PHImageRequestOptionsVersionOriginal (default), request original highest fidelity version
                      PHImageRequestOptionsVersionCurrent, request current version with all edits
                      PHImageRequestOptionsVersionUnadjusted, request highest quality unadjusted version
+            delivery_mode: optional Photos.PHVideoRequestOptionsDeliveryMode* value;
+                     defaults to PHVideoRequestOptionsDeliveryModeHighQualityFormat;
+                     pass PHVideoRequestOptionsDeliveryModeFastFormat when a
+                     lower-fidelity asset is acceptable (e.g. previews)
 
         Raises:
             ValueError if passed invalid value for version
@@ -1144,35 +1808,32 @@ class VideoAsset(PhotoAsset):
             ]:
                 raise ValueError("Invalid value for version")
 
-            options_request = Photos.PHVideoRequestOptions.alloc().init()
-            options_request.setNetworkAccessAllowed_(True)
-            options_request.setVersion_(version)
-            options_request.setDeliveryMode_(
-                Photos.PHVideoRequestOptionsDeliveryModeHighQualityFormat
-            )
-            requestdata = AVAssetData()
+            if delivery_mode is None:
+                delivery_mode = _DELIVERY_HIGH_QUALITY
+            options_request = _video_request_options(version, delivery_mode)
+            result = {}
             event = threading.Event()
 
             def handler(asset, audiomix, info):
                 """result handler for requestAVAssetForVideo:asset options:options resultHandler"""
-                nonlocal requestdata
-
-                requestdata.asset = asset
-                requestdata.audiomix = audiomix
-                requestdata.info = info
+                result["asset"] = asset
+                result["audiomix"] = audiomix
+                result["info"] = info
 
                 event.set()
 
             self._manager.requestAVAssetForVideo_options_resultHandler_(
                 self.phasset, options_request, handler
             )
-            event.wait()
+            _wait_for_completion(event)
 
-            # not sure why this is needed -- some weird ref count thing maybe
-            # if I don't do this, memory leaks
-            data = copy.copy(requestdata)
-            del requestdata
-            return data
+            # the old copy.copy(requestdata)/del dance worked around the
+            # handler closure (retained by the ObjC block until the pool
+            # drained) keeping the populated object alive; building the
+            # AVAssetData after the wait and dropping the handler reference
+            # leaves nothing holding onto it
+            handler = None
+            return AVAssetData(**result)
 
 
 class _LivePhotoRequest(NSObject):
@@ -1186,7 +1847,6 @@ class _LivePhotoRequest(NSObject):
             return None
         self.manager = manager
         self.asset = asset
-        self.nc = NSNotificationCenter.defaultCenter()
         return self
 
     def requestLivePhotoResources(self, version=PHImageRequestOptionsVersionCurrent):
@@ -1196,54 +1856,36 @@ class _LivePhotoRequest(NSObject):
             options = Photos.PHLivePhotoRequestOptions.alloc().init()
             options.setNetworkAccessAllowed_(True)
             options.setVersion_(version)
-            options.setDeliveryMode_(
-                Photos.PHVideoRequestOptionsDeliveryModeHighQualityFormat
-            )
-            delegate = _PhotoKitNotificationDelegate.alloc().init()
-
-            self.nc.addObserver_selector_name_object_(
-                delegate, "liveNotification:", None, None
-            )
+            options.setDeliveryMode_(_DELIVERY_HIGH_QUALITY)
 
             self.live_photo = None
+            event = threading.Event()
 
             def handler(result, info):
                 """result handler for requestLivePhotoForAsset:targetSize:contentMode:options:resultHandler:"""
                 if not info["PHImageResultIsDegradedKey"]:
                     self.live_photo = result
                     self.info = info
-                    self.nc.postNotificationName_object_(
-                        PHOTOKIT_NOTIFICATION_FINISHED_REQUEST, self
-                    )
-
-            try:
-                self.manager.requestLivePhotoForAsset_targetSize_contentMode_options_resultHandler_(
-                    self.asset,
-                    Photos.PHImageManagerMaximumSize,
-                    Photos.PHImageContentModeDefault,
-                    options,
-                    handler,
-                )
-                AppHelper.runConsoleEventLoop(installInterrupt=True)
-            except KeyboardInterrupt:
-                AppHelper.stopEventLoop()
-            finally:
-                pass
+                    event.set()
+
+            self.manager.requestLivePhotoForAsset_targetSize_contentMode_options_resultHandler_(
+                self.asset,
+                _MAXIMUM_SIZE,
+                _CONTENT_MODE_DEFAULT,
+                options,
+                handler,
+            )
+            _wait_for_completion(event)
 
-            asset_resources = Photos.PHAssetResource.assetResourcesForLivePhoto_(
+            # the NSArray needs no defensive copy; nothing else retains it
+            # once this method returns
+            return Photos.PHAssetResource.assetResourcesForLivePhoto_(
                 self.live_photo
             )
 
-            # not sure why this is needed -- some weird ref count thing maybe
-            # if I don't do this, memory leaks
-            data = copy.copy(asset_resources)
-            del asset_resources
-            return data
-
     def __del__(self):
         self.manager = None
         self.asset = None
-        self.nc = None
         self.live_photo = None
         self.info = None
         # super(NSObject, self).dealloc()
@@ -1260,6 +1902,7 @@ class LivePhotoAsset(PhotoAsset):
         overwrite=False,
         photo=True,
         video=True,
+        suppress_output=False,
         **kwargs,
     ):
         """Export image to path
@@ -1271,6 +1914,7 @@ class LivePhotoAsset(PhotoAsset):
             overwrite: bool, if True, overwrites destination file if it already exists; default is False
             photo: bool, if True, export photo component of live photo
             video: bool, if True, export live video component of live photo
+            suppress_output: bool, if True, capture C-level stdout/stderr during export; default is False (PhotoKit logging appears on stderr)
             **kwargs: used only to avoid issues with each asset type having slightly different export arguments
 
         Returns:
@@ -1281,29 +1925,34 @@ class LivePhotoAsset(PhotoAsset):
             PhotoKitExportError if error during export
         """
 
-        with objc.autorelease_pool():
-            with pipes() as (out, err):
-                filename = (
-                    pathlib.Path(filename)
-                    if filename
-                    else pathlib.Path(self.original_filename)
-                )
-
-                dest = pathlib.Path(dest)
-                if not dest.is_dir():
-                    raise ValueError("dest must be a valid directory: {dest}")
+        with _output_capture(suppress_output) as (out, err):
+            stem, dest = self._resolve_export_dest(dest, filename)
 
+            # repeated exports of the same asset (e.g. photo then video
+            # component) reuse the resource list rather than paying a live
+            # photo request round trip each time; invalidated by _refresh()
+            request = None
+            resources = self._live_photo_resources_cache.get(version)
+            if resources is None:
                 request = _LivePhotoRequest.alloc().initWithManager_Asset_(
                     self._manager, self.phasset
                 )
-                resources = request.requestLivePhotoResources(version=version)
+            # scope the pool to the resource request/classification stage so
+            # the temporaries it autoreleases drain before the (potentially
+            # long) streaming stage starts; the streamed resources are
+            # retained by the PyObjC references below so they survive the
+            # pool drain
+            with objc.autorelease_pool():
+                if resources is None:
+                    resources = request.requestLivePhotoResources(version=version)
+                    self._live_photo_resources_cache[version] = resources
 
                 video_resource = None
                 photo_resource = None
                 for resource in resources:
-                    if resource.type() == Photos.PHAssetResourceTypePairedVideo:
+                    if resource.type() == _RT_PAIRED_VIDEO:
                         video_resource = resource
-                    elif resource.type() == Photos.PHAssetMediaTypeImage:
+                    elif resource.type() == _MT_IMAGE:
                         photo_resource = resource
 
                 if not video_resource or not photo_resource:
@@ -1314,34 +1963,121 @@ class LivePhotoAsset(PhotoAsset):
                 photo_ext = get_preferred_uti_extension(
                     photo_resource.uniformTypeIdentifier()
                 )
-                photo_output_file = dest / f"{filename.stem}.{photo_ext}"
+                photo_output_file = os.path.join(dest, f"{stem}.{photo_ext}")
                 video_ext = get_preferred_uti_extension(
                     video_resource.uniformTypeIdentifier()
                 )
-                video_output_file = dest / f"{filename.stem}.{video_ext}"
-
-                if not overwrite:
-                    photo_output_file = pathlib.Path(
-                        increment_filename(photo_output_file)
-                    )
-                    video_output_file = pathlib.Path(
-                        increment_filename(video_output_file)
-                    )
+                video_output_file = os.path.join(dest, f"{stem}.{video_ext}")
 
-                exported = []
-                if photo:
-                    data = self._request_resource_data(photo_resource)
-                    # image_data = self.request_image_data(version=version)
-                    with open(photo_output_file, "wb") as fd:
-                        fd.write(data)
-                    exported.append(str(photo_output_file))
-                    del data
-                if video:
-                    data = self._request_resource_data(video_resource)
-                    with open(video_output_file, "wb") as fd:
-                        fd.write(data)
-                    exported.append(str(video_output_file))
-                    del data
+            photo_fd = video_fd = None
+            if not overwrite:
+                # reserve the names with O_CREAT|O_EXCL rather than
+                # increment_filename's stat-then-create so concurrent
+                # exports can't race each other to the same name
+                photo_output_file, photo_fd = reserve_unique_path(photo_output_file)
+                video_output_file, video_fd = reserve_unique_path(video_output_file)
+
+            def _export_resource(resource, output_file, fd):
+                """stream one live photo component to disk on a worker thread"""
+                # background threads have no implicit autorelease pool so
+                # push one explicitly to release bridge objects promptly
+                with objc.autorelease_pool():
+                    self._stream_resource_to_file(resource, output_file, fd=fd)
+                return output_file
+
+            tasks = []
+            if photo:
+                tasks.append((photo_resource, photo_output_file, photo_fd))
+            elif photo_fd is not None:
+                os.close(photo_fd)
+                os.unlink(photo_output_file)
+            if video:
+                tasks.append((video_resource, video_output_file, video_fd))
+            elif video_fd is not None:
+                os.close(video_fd)
+                os.unlink(video_output_file)
+
+            exported = []
+            if tasks:
+                # the photo and video components are independent; fetch
+                # them concurrently so total latency approaches the max
+                # of the two requests rather than their sum (matters
+                # when both components are iCloud-resident)
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(tasks)
+                ) as executor:
+                    futures = [
+                        executor.submit(_export_resource, resource, output_file, fd)
+                        for resource, output_file, fd in tasks
+                    ]
+                    # collect in submit order so the returned list stays
+                    # [photo, video] as before
+                    exported = [future.result() for future in futures]
 
+            if request is not None:
                 request.dealloc()
-                return exported
+            return exported
+
+
+def export_assets(
+    assets: list[Asset], dest, max_workers: int = 8, **kwargs
+) -> Iterator[list[str]]:
+    """Export multiple assets concurrently, yielding results as they complete
+
+    Args:
+        assets: list of Asset objects to export
+        dest: str, path to destination directory
+        max_workers: maximum number of concurrent exports; don't set this
+            much higher than the default as PhotoKit's daemon services a
+            limited number of concurrent requests (~8-16)
+        **kwargs: passed through to each asset's export() method
+
+    Yields:
+        list of exported path(s) for each asset, in completion order
+
+    Raises:
+        ValueError: if dest is not a valid directory; raised when
+            export_assets is called, before any export starts
+        PhotoKitExportError: if any asset fails to export; raised after all
+            other assets in the batch have finished so one bad asset doesn't
+            abort the rest
+
+    Note: Uses threads rather than processes: PHAsset objects can't be
+    pickled and PyObjC releases the GIL during ObjC calls, so the
+    I/O-bound export work overlaps well in threads.
+    """
+    # validate dest eagerly, at call time rather than first iteration, so a
+    # bad destination fails fast instead of surfacing as one export error
+    # per asset after the pool spins up; the generator body below only runs
+    # once the caller starts iterating, so the check must live out here
+    dest = str(dest)
+    if not os.path.isdir(dest):
+        raise ValueError(f"dest must be a valid directory: {dest}")
+
+    def _export_one(asset: Asset) -> list[str]:
+        # each worker pushes its own autorelease pool so the ObjC objects
+        # created during an export are released when that export finishes
+        # rather than accumulating for the lifetime of the batch
+        with objc.autorelease_pool():
+            return asset.export(dest, **kwargs)
+
+    def _export_all() -> Iterator[list[str]]:
+        errors = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {
+                executor.submit(_export_one, asset): asset.uuid for asset in assets
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    errors.append((futures[future], e))
+        if errors:
+            raise PhotoKitExportError(
+                f"Error exporting {len(errors)} asset(s): "
+                + "; ".join(f"{uuid}: {e}" for uuid, e in errors)
+            )
+
+    return _export_all()
@@ -12,9 +12,3 @@ PHImageRequestOptionsVersionCurrent = Photos.PHImageRequestOptionsVersionCurrent
 # access level
 PHAccessLevelAddOnly = Photos.PHAccessLevelAddOnly
 PHAccessLevelReadWrite = Photos.PHAccessLevelReadWrite
-
-# notification that gets sent to Notification Center
-PHOTOKIT_NOTIFICATION_FINISHED_REQUEST = "PyPhotoKitNotificationFinishedRequest"
-
-# minimum amount to sleep while waiting for export
-MIN_SLEEP = 0.015
@@ -1,5 +1,20 @@
 """Exceptions for photokit"""
 
+__all__ = [
+    "PhotoKitError",
+    "PhotoKitFetchFailed",
+    "PhotoKitAuthError",
+    "PhotoKitExportError",
+    "PhotoKitImportError",
+    "PhotoKitMediaTypeError",
+    "PhotoKitCreateLibraryError",
+    "PhotoKitAlbumCreateError",
+    "PhotoKitAlbumDeleteError",
+    "PhotoKitAlbumAddAssetError",
+    "PhotoKitChangeError",
+    "PhotoKitCreateKeywordError",
+]
+
 
 class PhotoKitError(Exception):
     """Base class for exceptions in this module."""
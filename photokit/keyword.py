@@ -18,7 +18,6 @@ def _fetch_keywords(titles: list[str]) -> list[Photos.PHKeyword]:
     if not titles:
         return []
     keywords = Photos.PHKeyword.fetchKeywordsWithTitles_options_(titles, None)
-    keyword_list = []
-    for idx in range(keywords.count()):
-        keyword_list.append(keywords.objectAtIndex_(idx))
-    return keyword_list
+    # PHFetchResult supports fast enumeration; list() crosses the bridge in
+    # batches instead of one objectAtIndex_ round trip per keyword
+    return list(keywords)
@@ -8,8 +8,10 @@ import logging
 import os
 import pathlib
 import plistlib
+import sys
 import threading
 import urllib.parse
+import weakref
 from typing import Any, Callable
 
 import CoreFoundation
@@ -17,10 +19,16 @@ import objc
 import Photos
 from Foundation import NSURL, NSString
 from ScriptingBridge import SBApplication
-from wurlitzer import pipes
 
 from .album import Album
-from .asset import Asset, LivePhotoAsset, PhotoAsset, VideoAsset
+from .asset import (
+    Asset,
+    LivePhotoAsset,
+    PhotoAsset,
+    VideoAsset,
+    _wait_for_completion,
+    export_assets,
+)
 from .constants import PHAccessLevelAddOnly, PHAccessLevelReadWrite
 from .exceptions import (
     PhotoKitAlbumCreateError,
@@ -100,6 +108,20 @@ class AssetChanges:
     removed: list[Asset]
     updated: list[Asset]
 
+    def summary(self):
+        """Yield (category, uuid, original_filename) tuples for all changes
+
+        Lets observer callbacks format an entire change batch in a single
+        write instead of one I/O call per asset.
+        """
+        for category, assets in (
+            ("added", self.added),
+            ("removed", self.removed),
+            ("updated", self.updated),
+        ):
+            for asset in assets:
+                yield category, asset.uuid, asset.original_filename
+
 
 class PhotoLibrary:
     """Interface to PhotoKit PHImageManager and PHPhotoLibrary"""
@@ -154,6 +176,10 @@ class PhotoLibrary:
         self._change_observer = None
         self._observed_assets = None
 
+        # pool of Album wrappers keyed by local identifier so repeated
+        # fetches of the same album return the same Album object
+        self._album_cache = weakref.WeakValueDictionary()
+
     @staticmethod
     def enable_multi_library_mode():
         """Enable multi-library mode.  This is a no-op if already enabled.
@@ -302,6 +328,10 @@ class PhotoLibrary:
         # I have not yet figured out what causes this
         # Suppress the errors with pipes() and raise error when it times out
         # Error appears to occur if a library with same name was recently created (even if it has since been deleted)
+        # imported here because this is the only cold path that needs it;
+        # keeps wurlitzer (and its reader-thread machinery) out of import
+        from wurlitzer import pipes
+
         with pipes() as (out, err):
             photo_library = Photos.PHPhotoLibrary.alloc().initWithPhotoLibraryURL_type_(
                 NSURL.fileURLWithPath_(library_path), 0
@@ -390,7 +420,7 @@ class PhotoLibrary:
                     album, (Photos.PHCollectionList, Photos.PHCloudSharedAlbum)
                 ):
                     album_list.append(album)
-            return [Album(self, album) for album in album_list]
+            return [self._album_factory(album) for album in album_list]
 
     def album(self, uuid: str | None = None, title: str | None = None) -> Album:
         """Get Album by UUID or name
@@ -470,7 +500,7 @@ class PhotoLibrary:
                 lambda: create_album_handler(title), completion_handler
             )
 
-            event.wait()
+            _wait_for_completion(event)
 
             return self.album(album_uuid)
 
@@ -505,7 +535,7 @@ class PhotoLibrary:
                 lambda: delete_album_handler(album), completion_handler
             )
 
-            event.wait()
+            _wait_for_completion(event)
 
     def folders(self):
         """ "Return list of folders in the library"""
@@ -561,6 +591,28 @@ class PhotoLibrary:
             return self.assets(selected_uuids)
         return []
 
+    def export_many(self, assets: list[Asset], dest, max_workers: int = 8, **kwargs):
+        """Export multiple assets concurrently, yielding results as they complete
+
+        PhotoKit's request methods are thread-safe and dispatch to their own
+        queues, so overlapping exports hides the PhotoKit and disk I/O
+        latency that makes a serial per-asset loop slow.
+
+        Args:
+            assets: list of Asset objects to export
+            dest: str, path to destination directory
+            max_workers: maximum number of concurrent exports
+            **kwargs: passed through to each asset's export() method
+
+        Yields:
+            list of exported path(s) for each asset, in completion order
+
+        Raises:
+            ValueError if dest is not a valid directory
+            PhotoKitExportError if any asset fails to export
+        """
+        return export_assets(assets, dest, max_workers=max_workers, **kwargs)
+
     def fetch_burst_uuid(self, burstid, all=False):
         """fetch PhotoAssets with burst ID = burstid
 
@@ -791,7 +843,7 @@ class PhotoLibrary:
                 lambda: import_asset_changes_handler(), completion_handler
             )
 
-            event.wait()
+            _wait_for_completion(event)
 
             return self.asset(asset_uuid)
 
@@ -840,7 +892,7 @@ class PhotoLibrary:
                 lambda: create_keyword_change_handler(keyword), completion_handler
             )
 
-            event.wait()
+            _wait_for_completion(event)
             logger.debug(f"Created keyword {keyword} with uuid {keyword_uuid}")
 
             if keyword_object := self._keywords_from_title_list([keyword]):
@@ -902,7 +954,7 @@ class PhotoLibrary:
                     raise PhotoKitFetchFailed(
                         f"Fetch did not return result for album_type {album_type}"
                     )
-                return Album(self, albums.objectAtIndex_(0))
+                return self._album_factory(albums.objectAtIndex_(0))
 
             # album name
             for i in range(albums.count()):
@@ -910,7 +962,7 @@ class PhotoLibrary:
                 if album.localizedTitle() == album_name and (
                     not user or album.isUserSmartAlbum()
                 ):
-                    return Album(self, album)
+                    return self._album_factory(album)
             raise PhotoKitFetchFailed(
                 f"Fetch did not return result for album {album_name}"
             )
@@ -955,7 +1007,7 @@ class PhotoLibrary:
                     continue
                 elif not user and album.isUserSmartAlbum():
                     continue
-                album_list.append(Album(self, album))
+                album_list.append(self._album_factory(album))
 
             if not album_list:
                 raise PhotoKitFetchFailed(
@@ -1044,7 +1096,7 @@ class PhotoLibrary:
                     uuids, fetch_object
                 ):
                     return [
-                        Album(self, fetch_result.objectAtIndex_(idx))
+                        self._album_factory(fetch_result.objectAtIndex_(idx))
                         for idx in range(fetch_result.count())
                     ]
                 else:
@@ -1118,10 +1170,7 @@ class PhotoLibrary:
             if fetch_result := self._phphotolibrary.fetchPHObjectsForUUIDs_entityName_(
                 uuids, fetch_object
             ):
-                return [
-                    fetch_result.objectAtIndex_(idx)
-                    for idx in range(fetch_result.count())
-                ]
+                return list(fetch_result)
             else:
                 raise PhotoKitFetchFailed(
                     f"Fetch did not return result for titles {titles}"
@@ -1148,6 +1197,22 @@ class PhotoLibrary:
         default_album = smart_albums.firstObject()
         return default_album
 
+    def _album_factory(self, collection: Photos.PHAssetCollection) -> Album:
+        """Return Album for a PHAssetCollection, reusing a cached wrapper if one exists
+
+        Args:
+            collection: PHAssetCollection object
+
+        Returns:
+            Album object for the collection
+        """
+        identifier = sys.intern(str(collection.localIdentifier()))
+        if album := self._album_cache.get(identifier):
+            return album
+        album = Album(self, collection)
+        self._album_cache[identifier] = album
+        return album
+
     def _asset_factory(self, phasset: Photos.PHAsset) -> Asset:
         """creates a PhotoAsset, VideoAsset, or LivePhotoAsset
 
@@ -1173,6 +1238,54 @@ class PhotoLibrary:
         else:
             raise PhotoKitMediaTypeError(f"Unknown media type: {media_type}")
 
+    def _asset_factory_batch(self, phassets) -> list[Asset]:
+        """creates PhotoAsset, VideoAsset, or LivePhotoAsset objects for a collection of PHAssets
+
+        Args:
+            phassets: iterable of PHAsset objects (e.g. an NSArray from a fetch result)
+
+        Returns:
+            list of PhotoAsset, VideoAsset, or LivePhotoAsset objects in the same order as phassets
+
+        Raises:
+            PhotoKitMediaTypeError if any PHAsset has an unknown media type
+        """
+
+        with objc.autorelease_pool():
+            phassets = list(phassets)
+
+            # classify everything first, then construct each wrapper class in
+            # its own homogeneous loop; this keeps the classification pass
+            # tight and avoids re-dispatching on type for every asset
+            live_indices = []
+            photo_indices = []
+            video_indices = []
+            for idx, phasset in enumerate(phassets):
+                media_type = phasset.mediaType()
+                if phasset.mediaSubtypes() & Photos.PHAssetMediaSubtypePhotoLive:
+                    live_indices.append(idx)
+                elif media_type == Photos.PHAssetMediaTypeImage:
+                    photo_indices.append(idx)
+                elif media_type == Photos.PHAssetMediaTypeVideo:
+                    video_indices.append(idx)
+                else:
+                    raise PhotoKitMediaTypeError(f"Unknown media type: {media_type}")
+
+            assets: list[Asset | None] = [None] * len(phassets)
+            for asset_class, indices in (
+                (LivePhotoAsset, live_indices),
+                (PhotoAsset, photo_indices),
+                (VideoAsset, video_indices),
+            ):
+                if not indices:
+                    continue
+                group = asset_class.from_phassets(
+                    self, [phassets[idx] for idx in indices]
+                )
+                for idx, asset in zip(indices, group):
+                    assets[idx] = asset
+            return assets
+
     def __len__(self):
         """Return number of assets in library"""
         return len(self.assets())
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 import re
 import subprocess
 import sys
@@ -575,6 +576,7 @@ def _get_ext_from_uti_dict(uti):
         return None
 
 
+@functools.lru_cache(maxsize=128)
 def get_preferred_uti_extension(uti: str) -> str | None:
     """get preferred extension for a UTI type
     uti: UTI str, e.g. 'public.jpeg'
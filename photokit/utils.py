@@ -114,6 +114,37 @@ def increment_filename_with_count(
     return normalize_fs_path(str(dest)), count
 
 
+def reserve_unique_path(filepath: str | pathlib.Path | os.PathLike) -> tuple[str, int]:
+    """Atomically reserve a non-existing filename based on filepath
+
+        Like increment_filename() but free of the stat-then-create race:
+        the candidate name is opened with O_CREAT|O_EXCL so the name is
+        claimed at the moment it is checked. If another thread or process
+        wins the race for a name, the count is incremented and the open
+        retried.
+
+    Args:
+        filepath: str or pathlib.Path; full path, including file name
+
+    Returns:
+        tuple of (filepath, fd) where filepath is the reserved path (possibly
+        incremented) and fd is an open file descriptor for writing to it;
+        the caller is responsible for closing fd
+
+    Raises:
+        OSError if the file cannot be created for reasons other than existing
+    """
+    count = 0
+    new_filepath, count = increment_filename_with_count(filepath)
+    while True:
+        try:
+            fd = os.open(new_filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            return new_filepath, fd
+        except FileExistsError:
+            count += 1
+            new_filepath, count = increment_filename_with_count(filepath, count)
+
+
 def increment_filename(filepath: str | pathlib.Path | os.PathLike) -> str:
     """Return filename (1).ext, etc if filename.ext exists
 